@@ -3,17 +3,26 @@ from UserManagement.Administrator import Administrator
 from UserManagement.Staff import Staff
 from UserManagement.Parent import Parent
 from UserManagement.User import User
+from Authenticator.PasswordHasher import PasswordHasher, CONFIG_FILE
 import datetime
-import hashlib
 import getpass
+import secrets
 
 
 class Authenticator:
     def __init__(self, fileManager: DataManagement):
         self.fileManager = fileManager
+        self.hasher = PasswordHasher.load(fileManager.getFilePath(CONFIG_FILE))
+        self.dummyHash = None
 
     def hashPassword(self, password: str) -> str:
-        return hashlib.sha256(password.encode()).hexdigest()
+        return self.hasher.hash(password)
+
+    #Made once with the current settings, on the first failed lookup
+    def getDummyHash(self) -> str:
+        if self.dummyHash is None:
+            self.dummyHash = self.hasher.hash(secrets.token_urlsafe(16))
+        return self.dummyHash
 
     def logAction(self, action: str):
         timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -23,44 +32,45 @@ class Authenticator:
             print("⚠️ Failed to log session.")
 
     def validateCredentials(self, username: str, password: str):
-        users = self.fileManager.read("users.txt")
-        hashedPw = self.hashPassword(password)
+        parts = self.fileManager.findUser(username)
+        if not parts or len(parts) != 4:
+            #Unknown usernames pay for a full hash too, so login timing doesn't reveal which names exist
+            self.hasher.verify(password, self.getDummyHash())
+            return None
 
-        for line in users:
-            parts = line.strip().split(":")
-            if len(parts) != 4:
-                continue
+        userId, role, uname, storedHash = parts
+        if not self.hasher.verify(password, storedHash):
+            #Legacy and outdated hashes fail faster than current ones; pad them to the same cost
+            if self.hasher.needsRehash(storedHash):
+                self.hasher.verify(password, self.getDummyHash())
+            return None
 
-            userId, role, uname, storedHash = parts
-            if uname == username and storedHash == hashedPw:
-                return userId, role, uname, storedHash
+        #Old SHA-256 records and hashes made with older settings are upgraded now, while the password is known
+        if self.hasher.needsRehash(storedHash):
+            newHash = self.hashPassword(password)
+            if self.fileManager.upsert("users.txt", f"{userId}:{role}:{uname}:{newHash}"):
+                storedHash = newHash
 
-        return None
+        return userId, role, uname, storedHash
     
     def authenticate(self):
-        users = self.fileManager.read("users.txt")
         username = input("Username: ").strip()
         password = getpass.getpass("Password: ").strip()
-        hashedPw = hashlib.sha256(password.encode()).hexdigest()
-
-        for line in users:
-            parts = line.strip().split(":")
-            if len(parts) != 4:
-                continue
-
-            userId, role, uname, storedHash = parts
-            if uname == username and storedHash == hashedPw:
-                print(f"✅ Login successful! Welcome, {uname} ({role})")
-
-                if role == "Admin":
-                    return Administrator(userId, uname, storedHash, role, self.fileManager, True)
-                elif role == "Staff":
-                    return Staff(userId, uname, storedHash, role, self.fileManager, True)
-                elif role == "Parent":
-                    return Parent(userId, uname, storedHash, role, self.fileManager, True)
-                else:
-                    print(f"⚠️ Unknown role '{role}', returning base User.")
-                    return User(userId, uname, storedHash, role, self.fileManager, True)
+
+        result = self.validateCredentials(username, password)
+        if result:
+            userId, role, uname, storedHash = result
+            print(f"✅ Login successful! Welcome, {uname} ({role})")
+
+            if role == "Admin":
+                return Administrator(userId, uname, storedHash, role, self.fileManager, True)
+            elif role == "Staff":
+                return Staff(userId, uname, storedHash, role, self.fileManager, True)
+            elif role == "Parent":
+                return Parent(userId, uname, storedHash, role, self.fileManager, True)
+            else:
+                print(f"⚠️ Unknown role '{role}', returning base User.")
+                return User(userId, uname, storedHash, role, self.fileManager, True)
 
         print("❌ Invalid username or password.")
         return None
@@ -0,0 +1,156 @@
+import os
+import sys
+import hmac
+import json
+import time
+import base64
+import hashlib
+import argparse
+
+#Stored hashes describe their own parameters so the settings can change without
+#breaking old records. users.txt is colon-delimited, so fields are joined with "$":
+#  scrypt$<n>$<r>$<p>$<salt>$<hash>
+#  pbkdf2_sha256$<iterations>$<salt>$<hash>
+#  <64 hex characters>                      legacy unsalted SHA-256
+CONFIG_FILE = "hasher.json"
+DEFAULTS = {
+    "scrypt": {"algorithm": "scrypt", "n": 2 ** 14, "r": 8, "p": 1},
+    "pbkdf2_sha256": {"algorithm": "pbkdf2_sha256", "iterations": 600000}
+}
+SALT_BYTES = 16
+KEY_BYTES = 32
+
+def encode(raw):
+    return base64.b64encode(raw).decode("ascii")
+
+def decode(text):
+    return base64.b64decode(text.encode("ascii"))
+
+def isLegacy(stored):
+    return len(stored) == 64 and all(c in "0123456789abcdef" for c in stored)
+
+
+class PasswordHasher:
+    def __init__(self, config=None):
+        config = dict(config or self.defaultConfig())
+        algorithm = config.get("algorithm")
+        if algorithm not in DEFAULTS or (algorithm == "scrypt" and not hasattr(hashlib, "scrypt")):
+            raise ValueError(f"Unsupported password hash algorithm '{algorithm}'")
+        self.config = {**DEFAULTS[algorithm], **config}
+
+    @staticmethod
+    def defaultConfig():
+        #hashlib.scrypt needs OpenSSL 1.1+; PBKDF2 is always there
+        return DEFAULTS["scrypt"] if hasattr(hashlib, "scrypt") else DEFAULTS["pbkdf2_sha256"]
+
+    @classmethod
+    def load(cls, path):
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                return cls(json.load(file))
+        except FileNotFoundError:
+            return cls()
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Ignoring {path} ({e}); using the default password hash settings.")
+            return cls()
+
+    def save(self, path):
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.config, file, indent=2)
+
+    def derive(self, password, salt, config):
+        if config["algorithm"] == "scrypt":
+            n, r, p = config["n"], config["r"], config["p"]
+            return hashlib.scrypt(password.encode(), salt=salt, n=n, r=r, p=p,
+                                  maxmem=max(32 * 1024 * 1024, 2 * 128 * r * (n + p)), dklen=KEY_BYTES)
+        return hashlib.pbkdf2_hmac("sha256", password.encode(), salt, config["iterations"], dklen=KEY_BYTES)
+
+    def hash(self, password):
+        salt = os.urandom(SALT_BYTES)
+        key = encode(self.derive(password, salt, self.config))
+        if self.config["algorithm"] == "scrypt":
+            return f"scrypt${self.config['n']}${self.config['r']}${self.config['p']}${encode(salt)}${key}"
+        return f"pbkdf2_sha256${self.config['iterations']}${encode(salt)}${key}"
+
+    @staticmethod
+    def parse(stored):
+        #-> (config, salt, key), or None for legacy and unrecognised hashes
+        parts = stored.split("$")
+        try:
+            if parts[0] == "scrypt" and len(parts) == 6:
+                return {"algorithm": "scrypt", "n": int(parts[1]), "r": int(parts[2]), "p": int(parts[3])}, decode(parts[4]), decode(parts[5])
+            if parts[0] == "pbkdf2_sha256" and len(parts) == 4:
+                return {"algorithm": "pbkdf2_sha256", "iterations": int(parts[1])}, decode(parts[2]), decode(parts[3])
+        except ValueError:
+            return None
+        return None
+
+    def verify(self, password, stored):
+        if isLegacy(stored):
+            return hmac.compare_digest(stored, hashlib.sha256(password.encode()).hexdigest())
+
+        parsed = self.parse(stored)
+        if parsed is None:
+            return False
+        config, salt, key = parsed
+        try:
+            return hmac.compare_digest(key, self.derive(password, salt, config))
+        except (ValueError, MemoryError):
+            return False
+
+    def needsRehash(self, stored):
+        #Legacy hashes and hashes made with other settings are replaced at the next login
+        parsed = self.parse(stored)
+        return parsed is None or any(self.config.get(name) != value for name, value in parsed[0].items())
+
+    def timeHash(self, password="Calibrate123!", rounds=3):
+        salt = os.urandom(SALT_BYTES)
+        timings = []
+        for _ in range(rounds):
+            started = time.perf_counter()
+            self.derive(password, salt, self.config)
+            timings.append(time.perf_counter() - started)
+        return min(timings)
+
+
+def calibrate(algorithm, targetSeconds):
+    #Raises the cost until one hash takes at least the target time on this machine
+    if algorithm == "scrypt":
+        config = {"algorithm": "scrypt", "n": 2 ** 10, "r": 8, "p": 1}
+        seconds = PasswordHasher(config).timeHash()
+        while seconds < targetSeconds and config["n"] < 2 ** 20:
+            config["n"] *= 2
+            seconds = PasswordHasher(config).timeHash()
+        return PasswordHasher(config), seconds
+
+    #PBKDF2 cost is linear in the iteration count, so one measurement is enough to scale from
+    sample = PasswordHasher({"algorithm": "pbkdf2_sha256", "iterations": 100000})
+    perIteration = sample.timeHash() / 100000
+    iterations = max(100000, int(targetSeconds / perIteration) // 10000 * 10000)
+    hasher = PasswordHasher({"algorithm": "pbkdf2_sha256", "iterations": iterations})
+    return hasher, hasher.timeHash()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Pick password hash settings that meet a target login time.")
+    parser.add_argument("dataDirectory", nargs="?", default="Data/")
+    parser.add_argument("--algorithm", choices=sorted(DEFAULTS), default=PasswordHasher.defaultConfig()["algorithm"])
+    parser.add_argument("--target-ms", type=float, default=100, help="time one password check should take (default: 100)")
+    parser.add_argument("--write", action="store_true", help=f"save the settings to <dataDirectory>/{CONFIG_FILE}")
+    args = parser.parse_args(argv)
+
+    path = os.path.join(args.dataDirectory, CONFIG_FILE)
+    current = PasswordHasher.load(path)
+    print(f"Current settings: {current.config} → {current.timeHash() * 1000:.1f} ms per check")
+
+    hasher, seconds = calibrate(args.algorithm, args.target_ms / 1000)
+    print(f"Calibrated settings: {hasher.config} → {seconds * 1000:.1f} ms per check (~{1 / seconds:,.0f} logins/s per core)")
+
+    if args.write:
+        hasher.save(path)
+        print(f"✅ Saved to {path}. Existing passwords are rehashed as each user next logs in.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
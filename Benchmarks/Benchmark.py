@@ -0,0 +1,193 @@
+import io
+import os
+import sys
+import json
+import time
+import shutil
+import builtins
+import argparse
+import platform
+import tempfile
+import datetime
+import statistics
+import contextlib
+
+from Benchmarks import SyntheticData
+from DataManagement.DataManagement import DataManagement
+from Authenticator.Authenticator import Authenticator
+from SessionManagement.Sessions import SessionManager
+from UserManagement.Administrator import Administrator
+from UserManagement.Parent import Parent
+
+#The menus call input() and print(); benchmarks feed scripted answers and discard the output
+@contextlib.contextmanager
+def scripted(answers=()):
+    pending = list(answers)
+    original = builtins.input
+    builtins.input = lambda prompt="": pending.pop(0) if pending else ""
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            yield
+    finally:
+        builtins.input = original
+
+def measure(operation, repeat, answers=()):
+    timings = []
+    for _ in range(repeat):
+        with scripted(answers):
+            started = time.perf_counter()
+            operation()
+            timings.append(time.perf_counter() - started)
+    return {
+        "runs": repeat,
+        "first": timings[0],
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "mean": statistics.fmean(timings),
+        "max": max(timings)
+    }
+
+def enrollmentCandidates(fileManager, manager, count):
+    #Eligible camper/session pairs that are not enrolled yet, picked before timing starts
+    candidates = []
+    sessions = sorted(manager.sessions.values(), key=lambda s: s.session_id)
+    for record in fileManager.iterRecords("camper.txt", fields=DataManagement.CAMPER_FIELDS):
+        for session in sessions:
+            if session.spots_available > 0 and session.min_age <= record[2] <= session.max_age \
+                    and not fileManager.isEnrolled(session.session_id, record[0]):
+                candidates.append((record[0], session.session_id))
+                break
+        if len(candidates) >= count:
+            break
+    return candidates
+
+def runSuite(fileManager, scale, repeat):
+    results = {}
+    lastParent = f"parent{scale['parents'] - 1}"
+    admin = Administrator("ADM_0", "admin", SyntheticData.PASSWORD_HASH, "Admin", fileManager, True)
+    parent = Parent("PRT_0", "parent0", SyntheticData.PASSWORD_HASH, "Parent", fileManager, True)
+    authenticator = Authenticator(fileManager)
+
+    results["validateCredentials"] = measure(lambda: authenticator.validateCredentials(lastParent, SyntheticData.PASSWORD), repeat)
+    results["validateCredentials.unknown"] = measure(lambda: authenticator.validateCredentials("nobody", SyntheticData.PASSWORD), repeat)
+
+    results["filterCampers.parent"] = measure(lambda: fileManager.filterCampers(parent_id="PRT_0"), repeat)
+    results["filterCampers.name"] = measure(lambda: fileManager.filterCampers(name="smith"), repeat)
+    results["filterCampers.ageRange"] = measure(lambda: fileManager.filterCampers(min_age=8, max_age=10), repeat)
+
+    started = time.perf_counter()
+    with scripted():
+        manager = SessionManager(fileManager)
+    results["SessionManager.load"] = {"runs": 1, "first": time.perf_counter() - started}
+
+    results["validateSessionDetails"] = measure(
+        lambda: manager.validateSessionDetails("Bench", "Hiking", "2030-01-01", "2030-01-07", 8, 12, "Instructor 0", 20), repeat)
+
+    candidates = enrollmentCandidates(fileManager, manager, repeat)
+    if candidates:
+        pairs = iter(candidates)
+        def enrollNext():
+            camper_id, session_id = next(pairs)
+            manager.enrollCamper(camper_id, session_id, admin)
+        results["enrollCamper"] = measure(enrollNext, len(candidates))
+
+    results["getNewCamperID"] = measure(parent.getNewCamperID, repeat)
+    results["generateId.parent"] = measure(lambda: admin.generateId("Parent"), repeat)
+    results["generateId.staff"] = measure(lambda: admin.generateId("Staff"), repeat)
+
+    results["generateUserReport"] = measure(admin.generateUserReport, repeat, ["3"])
+    results["generateCamperReport"] = measure(admin.generateCamperReport, repeat, ["3"])
+    results["generateSessionReport"] = measure(admin.generateSessionReport, repeat, ["3"])
+    results["generateLogReport"] = measure(admin.generateLogReport, repeat, ["3"])
+    results["generateLogReport.user"] = measure(admin.generateLogReport, repeat, ["1", "PRT_0"])
+
+    results["backupAll"] = measure(fileManager.backupAll, repeat)
+    return results
+
+def compare(results, baselinePath):
+    with open(baselinePath, "r", encoding="utf-8") as file:
+        baseline = json.load(file)["results"]
+
+    print(f"\n{'operation':34} {'baseline':>12} {'current':>12} {'ratio':>8}")
+    for name, current in results.items():
+        before = baseline.get(name)
+        key = "median" if "median" in current else "first"
+        if not before or key not in before:
+            continue
+        ratio = current[key] / before[key] if before[key] else float("inf")
+        print(f"{name:34} {before[key] * 1000:10.2f}ms {current[key] * 1000:10.2f}ms {ratio:7.2f}x")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark Happy Trails core operations against synthetic data.")
+    parser.add_argument("--campers", type=int, default=10000)
+    parser.add_argument("--sessions", type=int, default=500)
+    parser.add_argument("--log-lines", type=int, default=100000)
+    parser.add_argument("--parents", type=int, default=None)
+    parser.add_argument("--staff", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--backend", choices=["text", "sqlite"], default="text")
+    parser.add_argument("--journaled", action="store_true")
+    parser.add_argument("--workdir", default=None, help="where the synthetic data is generated (default: a temp directory)")
+    parser.add_argument("--keep", action="store_true", help="keep the generated data after the run")
+    parser.add_argument("--output", default="benchmark-results.json")
+    parser.add_argument("--compare", default=None, help="earlier results file to compare against")
+    args = parser.parse_args(argv)
+
+    workdir = args.workdir or tempfile.mkdtemp(prefix="happytrails-bench-")
+    dataDirectory = os.path.join(workdir, "Data") + os.sep
+
+    try:
+        print(f"🛠️ Generating synthetic data in {dataDirectory}")
+        started = time.perf_counter()
+        scale = SyntheticData.generate(dataDirectory, args.campers, args.sessions, args.log_lines,
+                                       parents=args.parents, staff=args.staff, seed=args.seed)
+        generation = time.perf_counter() - started
+
+        backUpFolder = os.path.join(workdir, "Data-Bak") + os.sep
+        reportsFolder = os.path.join(workdir, "Reports") + os.sep
+
+        if args.backend == "sqlite":
+            with contextlib.redirect_stdout(io.StringIO()):
+                migrator = DataManagement(dataDirectory, backUpFolder, reportsFolder, journaled=True)
+                try:
+                    migrator.migrateToSqlite()
+                finally:
+                    migrator.close()
+
+        fileManager = DataManagement(dataDirectory, backUpFolder, reportsFolder,
+                                     journaled=args.journaled, backend=args.backend)
+        try:
+            results = runSuite(fileManager, scale, args.repeat)
+        finally:
+            fileManager.close()
+    finally:
+        if not args.keep and not args.workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    report = {
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count()
+        },
+        "config": {"backend": args.backend, "journaled": args.journaled, "repeat": args.repeat},
+        "scale": scale,
+        "generationSeconds": generation,
+        "results": results
+    }
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2)
+
+    for name, result in results.items():
+        print(f"{name:34} {result.get('median', result['first']) * 1000:10.2f}ms")
+    print(f"✅ Results written to {args.output}")
+
+    if args.compare:
+        compare(results, args.compare)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,150 @@
+import io
+import os
+import sys
+import time
+import random
+import shutil
+import argparse
+import tempfile
+import contextlib
+import multiprocessing
+
+from Benchmarks import SyntheticData
+from DataManagement.DataManagement import DataManagement
+from SessionManagement.Sessions import SessionManager
+from UserManagement.Administrator import Administrator
+
+#Many processes enroll into the same few small sessions at once. Afterwards every
+#session must hold exactly as many enrollments as the spots it gave up, never more
+#than its capacity, and no camper may be enrolled twice.
+
+def openStore(dataDirectory, backend, journaled):
+    workdir = os.path.dirname(os.path.dirname(dataDirectory))
+    return DataManagement(dataDirectory, os.path.join(workdir, "Data-Bak") + os.sep,
+                          os.path.join(workdir, "Reports") + os.sep, journaled=journaled, backend=backend)
+
+def prepare(dataDirectory, campers, sessions, capacity, backend, journaled):
+    SyntheticData.generate(dataDirectory, campers=campers, sessions=0, logLines=0, enrollments=0)
+
+    #Small sessions every camper is old enough for, so capacity is the only limit
+    lines = [f"S{1000000 + i}:Stress {i}:Archery:2025-07-01:2025-07-07:0-99:0:99:{capacity}:{capacity}:Instructor {i}\n"
+             for i in range(sessions)]
+    fileManager = openStore(dataDirectory, backend, journaled)
+    try:
+        if backend == "sqlite":
+            fileManager.migrateToSqlite(force=True)
+        fileManager.write("sessions.txt", lines, append=False)
+    finally:
+        fileManager.close()
+    return [line.split(":")[0] for line in lines]
+
+def worker(dataDirectory, backend, journaled, pairs, batch, results):
+    fileManager = openStore(dataDirectory, backend, journaled)
+    admin = Administrator("ADM_0", "admin", SyntheticData.PASSWORD_HASH, "Admin", fileManager, True)
+    enrolled = 0
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            manager = SessionManager(fileManager)
+            if batch > 1:
+                for start in range(0, len(pairs), batch):
+                    outcome = manager.enrollCampersBulk(pairs[start:start + batch])
+                    enrolled += sum(1 for result in outcome if result["status"] == "enrolled")
+            else:
+                for camper_id, session_id in pairs:
+                    enrolled += bool(manager.enrollCamper(camper_id, session_id, admin))
+    finally:
+        fileManager.close()
+    results.put(enrolled)
+
+def verify(dataDirectory, backend, journaled, sessionIDs, capacity, demand):
+    fileManager = openStore(dataDirectory, backend, journaled)
+    problems = []
+    try:
+        manager = SessionManager(fileManager)
+        records = [line.strip().split(":", 3) for line in fileManager.read("session_enrollments.txt") if line.strip()]
+        pairs = [(r[0], r[1]) for r in records]
+        if len(pairs) != len(set(pairs)):
+            problems.append(f"{len(pairs) - len(set(pairs))} duplicate enrollment(s)")
+
+        waitlist = manager.getWaitlist()
+        for sid in sessionIDs:
+            session = manager.sessions[sid]
+            count = sum(1 for pair in set(pairs) if pair[0] == sid)
+            expected = min(capacity, demand[sid])
+            if session.spots_available < 0:
+                problems.append(f"{sid} has {session.spots_available} spots left")
+            if count > capacity:
+                problems.append(f"{sid} oversold: {count} enrollments for {capacity} spots")
+            if count != capacity - session.spots_available:
+                problems.append(f"{sid} has {count} enrollments but gave up {capacity - session.spots_available} spots")
+            if count != expected:
+                problems.append(f"{sid} filled {count} of the {expected} spots it should have")
+            if len(waitlist.queue(sid)) != demand[sid] - count:
+                problems.append(f"{sid} waitlist holds {len(waitlist.queue(sid))} campers, expected {demand[sid] - count}")
+    finally:
+        fileManager.close()
+    return len(set(pairs)), problems
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Enroll from many processes at once and check nothing is oversold.")
+    parser.add_argument("--processes", type=int, default=8)
+    parser.add_argument("--campers", type=int, default=400)
+    parser.add_argument("--sessions", type=int, default=4)
+    parser.add_argument("--capacity", type=int, default=25)
+    parser.add_argument("--batch", type=int, default=1, help="enroll through the bulk path in batches of this size")
+    parser.add_argument("--backend", choices=["text", "sqlite"], default="text")
+    parser.add_argument("--journaled", action="store_true")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workdir", default=None, help="where the data is generated (default: a temp directory)")
+    parser.add_argument("--keep", action="store_true", help="keep the generated data after the run")
+    args = parser.parse_args(argv)
+
+    workdir = args.workdir or tempfile.mkdtemp(prefix="happytrails-stress-")
+    dataDirectory = os.path.join(workdir, "Data") + os.sep
+    try:
+        sessionIDs = prepare(dataDirectory, args.campers, args.sessions, args.capacity, args.backend, args.journaled)
+
+        #Every process tries every request in its own order, so the same camper and
+        #session pair is always contended by several processes
+        rng = random.Random(args.seed)
+        requests = [(f"CMP{i:04d}", sessionIDs[i % len(sessionIDs)]) for i in range(1, args.campers + 1)]
+        demand = {sid: sum(1 for _, s in requests if s == sid) for sid in sessionIDs}
+        plans = []
+        for _ in range(args.processes):
+            plan = list(requests)
+            rng.shuffle(plan)
+            plans.append(plan)
+
+        results = multiprocessing.Queue()
+        processes = [multiprocessing.Process(target=worker, args=(dataDirectory, args.backend, args.journaled, plan, args.batch, results))
+                     for plan in plans]
+        started = time.perf_counter()
+        for process in processes:
+            process.start()
+        reported = sum(results.get() for _ in processes)
+        for process in processes:
+            process.join()
+        seconds = time.perf_counter() - started
+
+        enrolled, problems = verify(dataDirectory, args.backend, args.journaled, sessionIDs, args.capacity, demand)
+        attempts = args.processes * len(requests)
+        print(f"{args.processes} process(es) made {attempts} enrollment attempts in {seconds:.2f}s ({attempts / seconds:,.0f}/s)")
+        print(f"{enrolled} enrollment(s) stored, {reported} reported as successful by the workers")
+        if reported != enrolled:
+            problems.append(f"workers reported {reported} enrollments but {enrolled} were stored")
+        if any(process.exitcode for process in processes):
+            problems.append("a worker process exited with an error")
+
+        for problem in problems:
+            print(f"❌ {problem}")
+        if not problems:
+            print(f"✅ No session oversold; every count matches across {len(sessionIDs)} session(s).")
+        return 1 if problems else 0
+    finally:
+        if not args.keep and not args.workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
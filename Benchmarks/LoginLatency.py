@@ -0,0 +1,90 @@
+import io
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import statistics
+import contextlib
+
+from Benchmarks import SyntheticData
+from DataManagement.DataManagement import DataManagement
+from Authenticator.Authenticator import Authenticator
+from Authenticator.PasswordHasher import PasswordHasher, CONFIG_FILE
+
+#Times logins under different password hash settings. Every synthetic account
+#starts with a legacy SHA-256 hash, so each account's first login also pays for
+#the rehash and its write; the second login is the steady-state cost.
+SWEEP = [
+    {"algorithm": "scrypt", "n": 2 ** 12, "r": 8, "p": 1},
+    {"algorithm": "scrypt", "n": 2 ** 14, "r": 8, "p": 1},
+    {"algorithm": "scrypt", "n": 2 ** 15, "r": 8, "p": 1},
+    {"algorithm": "pbkdf2_sha256", "iterations": 100000},
+    {"algorithm": "pbkdf2_sha256", "iterations": 600000}
+]
+
+def timeLogins(auth, usernames):
+    timings = []
+    for username in usernames:
+        started = time.perf_counter()
+        if not auth.validateCredentials(username, SyntheticData.PASSWORD):
+            raise RuntimeError(f"login failed for {username}")
+        timings.append(time.perf_counter() - started)
+    return {"median": statistics.median(timings), "mean": statistics.fmean(timings), "max": max(timings)}
+
+def run(workdir, config, parents, logins):
+    dataDirectory = os.path.join(workdir, "Data") + os.sep
+    shutil.rmtree(workdir, ignore_errors=True)
+    SyntheticData.generate(dataDirectory, campers=10, sessions=1, logLines=0, parents=parents, enrollments=0)
+    if config is not None:
+        PasswordHasher(config).save(os.path.join(dataDirectory, CONFIG_FILE))
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        fileManager = DataManagement(dataDirectory, os.path.join(workdir, "Data-Bak") + os.sep,
+                                     os.path.join(workdir, "Reports") + os.sep, journaled=True)
+    try:
+        auth = Authenticator(fileManager)
+        step = max(1, parents // logins)
+        usernames = [f"parent{i}" for i in range(0, parents, step)][:logins]
+        auth.validateCredentials("admin", SyntheticData.PASSWORD)  #builds the users index outside the timings
+        return {
+            "config": auth.hasher.config,
+            "firstLogin": timeLogins(auth, usernames),
+            "login": timeLogins(auth, usernames)
+        }
+    finally:
+        fileManager.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure login latency for different password hash settings.")
+    parser.add_argument("--parents", type=int, default=10000)
+    parser.add_argument("--logins", type=int, default=20, help="accounts logged into per setting")
+    parser.add_argument("--sweep", action="store_true", help="try a range of settings instead of just the defaults")
+    parser.add_argument("--output", default=None, help="also write the results as JSON")
+    args = parser.parse_args(argv)
+
+    workdir = tempfile.mkdtemp(prefix="happytrails-login-")
+    try:
+        results = [run(os.path.join(workdir, str(i)), config, args.parents, args.logins)
+                   for i, config in enumerate(SWEEP if args.sweep else [None])]
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print(f"{'settings':45} {'first login':>12} {'login':>10} {'logins/s':>10}")
+    for result in results:
+        settings = ", ".join(f"{k}={v}" for k, v in result["config"].items())
+        median = result["login"]["median"]
+        print(f"{settings:45} {result['firstLogin']['median'] * 1000:10.1f}ms {median * 1000:8.1f}ms {1 / median:10,.0f}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+        print(f"✅ Results written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+import sys
+import json
+import random
+import time
+import argparse
+import datetime
+import tracemalloc
+
+from Benchmarks import SyntheticData
+from SessionManagement.Sessions import Session
+
+#The previous dict-backed Session, kept here as the baseline being measured against
+class DictSession:
+    def __init__(self, session_id, name, activity_type, start_date, end_date, age_group_label, min_age, max_age, capacity, spots_available, instructor):
+        self.session_id = session_id
+        self.name = name
+        self.activity_type = activity_type
+        self.start_date = start_date
+        self.end_date = end_date
+        self.age_group_label = age_group_label
+        self.min_age = min_age
+        self.max_age = max_age
+        self.capacity = capacity
+        self.spots_available = spots_available
+        self.instructor = instructor
+
+    def toRecord(self):
+        return f"{self.session_id}:{self.name}:{self.activity_type}:{self.start_date}:{self.end_date}:" \
+               f"{self.age_group_label}:{self.min_age}:{self.max_age}:{self.capacity}:" \
+               f"{self.spots_available}:{self.instructor}\n"
+
+    @staticmethod
+    def fromRecord(line):
+        parts = line.strip().split(":")
+        if len(parts) != 11:
+            return None
+        return DictSession(parts[0], parts[1], parts[2], parts[3], parts[4], parts[5],
+                           int(parts[6]), int(parts[7]), int(parts[8]), int(parts[9]), parts[10])
+
+def dictOverlaps(sessions, start, end):
+    #What validateSessionDetails used to do for every existing session
+    hits = 0
+    for s in sessions:
+        s1_start = datetime.datetime.strptime(s.start_date, "%Y-%m-%d").date()
+        s1_end = datetime.datetime.strptime(s.end_date, "%Y-%m-%d").date()
+        if not (end < s1_start or start > s1_end):
+            hits += 1
+    return hits
+
+def slotOverlaps(sessions, start, end):
+    return sum(1 for s in sessions if not (end < s.start_date or start > s.end_date))
+
+def catalogue(count, seed):
+    #Session lines in the synthetic data format, with no files written
+    rng = random.Random(seed)
+    instructors = max(1, count // 10)
+    first = datetime.date(2025, 6, 1)
+    lines = []
+    for i in range(count):
+        start = first + datetime.timedelta(days=7 * (i // instructors))
+        end = start + datetime.timedelta(days=6)
+        low = rng.randint(6, 14)
+        high = min(17, low + rng.randint(2, 4))
+        capacity = rng.randint(10, 40)
+        activity = rng.choice(SyntheticData.ACTIVITIES)
+        lines.append(f"S{1000000 + i}:{activity} Week {i}:{activity}:{start.isoformat()}:{end.isoformat()}:"
+                     f"{low}-{high}:{low}:{high}:{capacity}:{capacity}:Instructor {i % instructors}")
+    return lines
+
+def profile(model, lines, overlaps):
+    tracemalloc.start()
+    started = time.perf_counter()
+    sessions = [model.fromRecord(line) for line in lines]
+    parseSeconds = time.perf_counter() - started
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    started = time.perf_counter()
+    records = [s.toRecord() for s in sessions]
+    recordSeconds = time.perf_counter() - started
+
+    start, end = datetime.date(2025, 7, 1), datetime.date(2025, 7, 3)
+    started = time.perf_counter()
+    hits = overlaps(sessions, start, end)
+    overlapSeconds = time.perf_counter() - started
+
+    return {
+        "bytes": current,
+        "bytesPerSession": current / len(lines),
+        "fromRecordSeconds": parseSeconds,
+        "toRecordSeconds": recordSeconds,
+        "overlapScanSeconds": overlapSeconds,
+        "overlaps": hits,
+        "roundTrip": [model.fromRecord(record).toRecord() for record in records] == records
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare the slotted Session model with the old dict-backed one.")
+    parser.add_argument("--sessions", type=int, default=50000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=None, help="also write the results as JSON")
+    args = parser.parse_args(argv)
+
+    lines = catalogue(args.sessions, args.seed)
+    results = {
+        "sessions": args.sessions,
+        "dict": profile(DictSession, lines, dictOverlaps),
+        "slots": profile(Session, lines, slotOverlaps)
+    }
+
+    baseline, current = results["dict"], results["slots"]
+    print(f"{'':22} {'dict':>14} {'slots':>14} {'ratio':>8}")
+    for key in ("bytesPerSession", "fromRecordSeconds", "toRecordSeconds", "overlapScanSeconds"):
+        ratio = current[key] / baseline[key] if baseline[key] else float("inf")
+        print(f"{key:22} {baseline[key]:14.6f} {current[key]:14.6f} {ratio:7.2f}x")
+    print(f"Round trip identical: {current['roundTrip']}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+        print(f"✅ Results written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
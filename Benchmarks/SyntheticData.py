@@ -0,0 +1,119 @@
+import os
+import random
+import hashlib
+import datetime
+
+FIRST_NAMES = ["Olivia", "Liam", "Emma", "Noah", "Ava", "Elijah", "Sophia", "Mateo", "Mia", "Lucas",
+               "Amelia", "Levi", "Harper", "Ezra", "Evelyn", "James", "Luna", "Asher", "Ella", "Jacob"]
+LAST_NAMES = ["Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis", "Rodriguez",
+              "Martinez", "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson", "Thomas", "Taylor", "Moore"]
+ACTIVITIES = ["Canoeing", "Archery", "Arts & Crafts", "Hiking", "Swimming", "Drama", "Robotics", "Soccer"]
+MEDICAL = ["N/A", "N/A", "N/A", "N/A", "Asthma", "Peanut allergy", "Diabetes", "Bee sting allergy"]
+ACTIONS = ["Viewed camper by ID", "Registered camper", "Generated User Report (all users)",
+           "Updated camper", "Viewed all campers", "Recorded attendance"]
+
+#Every synthetic account shares this password so logins can be timed
+PASSWORD = "Benchmark123!"
+PASSWORD_HASH = hashlib.sha256(PASSWORD.encode()).hexdigest()
+CHUNK = 10000
+
+def writeLines(path, lines):
+    with open(path, "w", encoding="utf-8") as file:
+        buffer = []
+        for line in lines:
+            buffer.append(line)
+            if len(buffer) >= CHUNK:
+                file.write("\n".join(buffer) + "\n")
+                buffer = []
+        if buffer:
+            file.write("\n".join(buffer) + "\n")
+
+def generate(directory, campers=10000, sessions=500, logLines=100000, parents=None, staff=50, instructors=None, enrollments=None, seed=0):
+    rng = random.Random(seed)
+    parents = parents or max(1, campers // 2)
+    instructors = instructors or max(1, sessions // 10)
+    enrollments = campers // 4 if enrollments is None else enrollments
+    today = datetime.date(2025, 6, 1)
+    os.makedirs(directory, exist_ok=True)
+
+    def users():
+        yield f"ADM_0:Admin:admin:{PASSWORD_HASH}"
+        for i in range(staff):
+            yield f"STF_{i}:Staff:staff{i}:{PASSWORD_HASH}"
+        for i in range(parents):
+            yield f"PRT_{i}:Parent:parent{i}:{PASSWORD_HASH}"
+
+    camperRows = []
+    def camperLines():
+        for i in range(1, campers + 1):
+            age = rng.randint(6, 17)
+            dob = today.replace(year=today.year - age) - datetime.timedelta(days=rng.randint(0, 300))
+            name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+            camperRows.append((f"CMP{i:04d}", name, age))
+            yield f"CMP{i:04d}:{name}:{age}:{dob.isoformat()}:PRT_{rng.randrange(parents)}:{rng.choice(MEDICAL)}"
+
+    #Each instructor teaches back-to-back one-week sessions, so the catalogue is overlap free
+    sessionRows = []
+    def sessionLines():
+        nextStart = {}
+        for i in range(sessions):
+            instructor = f"Instructor {i % instructors}"
+            start = nextStart.get(instructor, today)
+            end = start + datetime.timedelta(days=6)
+            nextStart[instructor] = end + datetime.timedelta(days=1)
+            low = rng.randint(6, 14)
+            high = min(17, low + rng.randint(2, 4))
+            capacity = rng.randint(10, 40)
+            sessionRows.append([f"S{1000000 + i}", low, high, capacity])
+            activity = rng.choice(ACTIVITIES)
+            yield (f"S{1000000 + i}:{activity} Week {i}:{activity}:{start.isoformat()}:{end.isoformat()}:"
+                   f"{low}-{high}:{low}:{high}:{capacity}:{capacity}:{instructor}")
+
+    writeLines(os.path.join(directory, "users.txt"), users())
+    writeLines(os.path.join(directory, "camper.txt"), camperLines())
+    sessionCatalogue = list(sessionLines())
+
+    enrollmentLines = []
+    seen = set()
+    taken = {}
+    for _ in range(enrollments if sessionRows else 0):
+        cid, name, age = rng.choice(camperRows)
+        sid, low, high, capacity = rng.choice(sessionRows)
+        if not low <= age <= high or (sid, cid) in seen or taken.get(sid, 0) >= capacity:
+            continue
+        seen.add((sid, cid))
+        taken[sid] = taken.get(sid, 0) + 1
+        enrollmentLines.append(f"{sid}:{cid}:{name}:2025-05-01 09:00")
+
+    #Spots reflect the generated enrollments
+    for i, line in enumerate(sessionCatalogue):
+        parts = line.split(":")
+        parts[9] = str(int(parts[8]) - taken.get(parts[0], 0))
+        sessionCatalogue[i] = ":".join(parts)
+
+    writeLines(os.path.join(directory, "sessions.txt"), sessionCatalogue)
+    writeLines(os.path.join(directory, "session_enrollments.txt"), enrollmentLines)
+
+    def logLinesGen():
+        start = datetime.datetime(2025, 1, 1)
+        for i in range(logLines):
+            uid = rng.randrange(parents)
+            stamp = (start + datetime.timedelta(seconds=i * 7)).strftime("%Y-%m-%d %H:%M:%S")
+            yield f"PRT_{uid}:parent{uid}:{rng.choice(ACTIONS)}:{stamp}"
+
+    writeLines(os.path.join(directory, "log.txt"), logLinesGen())
+    writeLines(os.path.join(directory, "attendance.txt"),
+               (f"{cid}:{name}:{rng.choice(['Present', 'Absent'])}:2025-06-0{1 + i % 5} 09:30"
+                for i, (cid, name, _) in enumerate(camperRows[:min(len(camperRows), 1000)])))
+    writeLines(os.path.join(directory, "summary.txt"), [])
+
+    return {
+        "campers": campers,
+        "sessions": sessions,
+        "logLines": logLines,
+        "parents": parents,
+        "staff": staff,
+        "instructors": instructors,
+        "enrollments": len(enrollmentLines),
+        "seed": seed
+    }
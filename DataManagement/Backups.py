@@ -0,0 +1,292 @@
+import os
+import json
+import lzma
+import time
+import zlib
+import shutil
+import hashlib
+import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+CHUNK_SIZE = 1024 * 1024
+
+def hashRange(path, offset=0, length=None):
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        file.seek(offset)
+        remaining = length
+        while remaining is None or remaining > 0:
+            chunk = file.read(CHUNK_SIZE if remaining is None else min(CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            digest.update(chunk)
+            if remaining is not None:
+                remaining -= len(chunk)
+    return digest.hexdigest()
+
+def copyRange(sourcePath, targetPath, offset=0):
+    digest = hashlib.sha256()
+    size = 0
+    with open(sourcePath, "rb") as source, open(targetPath, "wb") as target:
+        source.seek(offset)
+        while True:
+            chunk = source.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            digest.update(chunk)
+            target.write(chunk)
+            size += len(chunk)
+    return size, digest.hexdigest()
+
+def listBackups(backUpFolder, prefix):
+    #Only completed backups (renamed from .partial, with a manifest) are listed
+    if not os.path.isdir(backUpFolder):
+        return []
+    names = [n for n in os.listdir(backUpFolder)
+             if n.startswith(prefix) and not n.endswith(".partial")
+             and os.path.exists(os.path.join(backUpFolder, n, "manifest.json"))]
+    return sorted(names)
+
+def loadManifest(backUpFolder, name):
+    with open(os.path.join(backUpFolder, name, "manifest.json"), "r", encoding="utf-8") as file:
+        return json.load(file)
+
+def linkOrCopy(sourcePath, targetPath):
+    try:
+        os.link(sourcePath, targetPath)
+        return True
+    except OSError:
+        shutil.copyfile(sourcePath, targetPath)
+        return False
+
+
+class SnapshotBackup:
+    #Files that only ever grow; a new snapshot stores just the appended tail
+    APPEND_ONLY = ("log.txt", "attendance.txt", "session_enrollments.txt", "waitlist.txt")
+    PREFIX = "snapshot-"
+
+    def __init__(self, backUpFolder, keepGenerations=10):
+        self.backUpFolder = backUpFolder
+        self.keepGenerations = keepGenerations
+
+    def snapshots(self):
+        return listBackups(self.backUpFolder, self.PREFIX)
+
+    def loadManifest(self, name):
+        return loadManifest(self.backUpFolder, name)
+
+    def create(self, fileManager, filenames):
+        previous = self.snapshots()
+        prevName = previous[-1] if previous else None
+        prevFiles = self.loadManifest(prevName)["files"] if prevName else {}
+        prevDir = os.path.join(self.backUpFolder, prevName) if prevName else None
+
+        name = self.PREFIX + datetime.datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+        finalDir = os.path.join(self.backUpFolder, name)
+        workDir = finalDir + ".partial"
+        os.makedirs(workDir)
+
+        manifest = {"created": datetime.datetime.now().isoformat(timespec="seconds"), "previous": prevName, "files": {}}
+        results = []
+
+        for filename in filenames:
+            if not os.path.exists(fileManager.getFilePath(filename)):
+                results.append((filename, "missing", 0))
+                continue
+
+            #Writers wait while this table is captured, so the copy is consistent
+            with fileManager.capture(filename) as sourcePath:
+                entry, status, copied = self.captureFile(filename, sourcePath, prevFiles.get(filename), prevDir, workDir)
+
+            manifest["files"][filename] = entry
+            results.append((filename, status, copied))
+
+        with open(os.path.join(workDir, "manifest.json"), "w", encoding="utf-8") as file:
+            json.dump(manifest, file, indent=2)
+            file.flush()
+            os.fsync(file.fileno())
+
+        #The snapshot only becomes visible once it is complete
+        os.rename(workDir, finalDir)
+        self.prune()
+        return name, results
+
+    def captureFile(self, filename, sourcePath, prev, prevDir, workDir):
+        st = os.stat(sourcePath)
+        entry = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "segments": []}
+
+        #Untouched since the last snapshot: hard-link every segment
+        if prev and prev["size"] == st.st_size and prev["mtime_ns"] == st.st_mtime_ns:
+            self.linkSegments(prev, prevDir, workDir, entry)
+            return entry, "unchanged", 0
+
+        if prev and filename in self.APPEND_ONLY and st.st_size > prev["size"] and self.prefixMatches(sourcePath, prev):
+            self.linkSegments(prev, prevDir, workDir, entry)
+            segment = f"{filename}.{len(prev['segments'])}"
+            size, digest = copyRange(sourcePath, os.path.join(workDir, segment), prev["size"])
+            entry["segments"].append({"name": segment, "size": size, "sha256": digest})
+            entry["size"] = prev["size"] + size
+            return entry, "appended", size
+
+        digest = hashRange(sourcePath)
+        if prev and len(prev["segments"]) == 1 and prev["segments"][0]["sha256"] == digest:
+            self.linkSegments(prev, prevDir, workDir, entry)
+            return entry, "unchanged", 0
+
+        segment = f"{filename}.0"
+        size, digest = copyRange(sourcePath, os.path.join(workDir, segment))
+        entry["size"] = size
+        entry["segments"].append({"name": segment, "size": size, "sha256": digest})
+        return entry, "copied", size
+
+    def prefixMatches(self, sourcePath, prev):
+        #Append-only files are checked by re-hashing only the last stored segment's range
+        if not prev["segments"]:
+            return prev["size"] == 0
+        last = prev["segments"][-1]
+        offset = prev["size"] - last["size"]
+        return hashRange(sourcePath, offset, last["size"]) == last["sha256"]
+
+    def linkSegments(self, prev, prevDir, workDir, entry):
+        for segment in prev["segments"]:
+            linkOrCopy(os.path.join(prevDir, segment["name"]), os.path.join(workDir, segment["name"]))
+            entry["segments"].append(dict(segment))
+
+    def prune(self):
+        names = self.snapshots()
+        for name in names[:max(0, len(names) - self.keepGenerations)]:
+            shutil.rmtree(os.path.join(self.backUpFolder, name), ignore_errors=True)
+
+
+class ArchiveBackup:
+    PREFIX = "archive-"
+    METHODS = {"zlib": ".z", "lzma": ".xz"}
+
+    def __init__(self, backUpFolder, workers=None):
+        self.backUpFolder = backUpFolder
+        self.workers = workers or min(8, (os.cpu_count() or 1) + 1)
+
+    def archives(self):
+        return listBackups(self.backUpFolder, self.PREFIX)
+
+    def loadManifest(self, name):
+        return loadManifest(self.backUpFolder, name)
+
+    @staticmethod
+    def compressor(method):
+        return zlib.compressobj(6) if method == "zlib" else lzma.LZMACompressor(preset=6)
+
+    @staticmethod
+    def decompressor(method):
+        return zlib.decompressobj() if method == "zlib" else lzma.LZMADecompressor()
+
+    #zlib and lzma release the GIL on large buffers, so a thread pool compresses files concurrently
+    def create(self, fileManager, filenames, method="zlib"):
+        if method not in self.METHODS:
+            raise ValueError(f"Unknown compression method '{method}'")
+
+        name = self.PREFIX + datetime.datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+        finalDir = os.path.join(self.backUpFolder, name)
+        workDir = finalDir + ".partial"
+        os.makedirs(workDir)
+
+        present = [f for f in filenames if os.path.exists(fileManager.getFilePath(f))]
+        started = time.perf_counter()
+
+        def compressFile(filename):
+            target = os.path.join(workDir, filename + self.METHODS[method])
+            with fileManager.capture(filename) as sourcePath:
+                return filename, self.compressStream(sourcePath, target, method)
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                files = dict(pool.map(compressFile, present))
+        except BaseException:
+            shutil.rmtree(workDir, ignore_errors=True)
+            raise
+
+        elapsed = time.perf_counter() - started
+        manifest = {
+            "created": datetime.datetime.now().isoformat(timespec="seconds"),
+            "method": method,
+            "files": files
+        }
+        with open(os.path.join(workDir, "manifest.json"), "w", encoding="utf-8") as file:
+            json.dump(manifest, file, indent=2)
+            file.flush()
+            os.fsync(file.fileno())
+
+        os.rename(workDir, finalDir)
+        return name, manifest, elapsed
+
+    def compressStream(self, sourcePath, targetPath, method):
+        compressor = self.compressor(method)
+        digest = hashlib.sha256()
+        size = 0
+        with open(sourcePath, "rb") as source, open(targetPath, "wb") as target:
+            while True:
+                chunk = source.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                digest.update(chunk)
+                size += len(chunk)
+                target.write(compressor.compress(chunk))
+            target.write(compressor.flush())
+            compressedSize = target.tell()
+        return {"size": size, "sha256": digest.hexdigest(), "compressedSize": compressedSize}
+
+    def decompressStream(self, sourcePath, targetPath, method):
+        decompressor = self.decompressor(method)
+        digest = hashlib.sha256()
+        size = 0
+        with open(sourcePath, "rb") as source, open(targetPath, "wb") as target:
+            while True:
+                chunk = source.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                data = decompressor.decompress(chunk)
+                digest.update(data)
+                size += len(data)
+                target.write(data)
+            if method == "zlib":
+                data = decompressor.flush()
+                digest.update(data)
+                size += len(data)
+                target.write(data)
+            target.flush()
+            os.fsync(target.fileno())
+        return size, digest.hexdigest()
+
+    #Every file is decompressed and verified into a temp file first; the data
+    #directory is only touched once all checksums match.
+    def restore(self, fileManager, name):
+        manifest = self.loadManifest(name)
+        method = manifest["method"]
+        archiveDir = os.path.join(self.backUpFolder, name)
+        started = time.perf_counter()
+
+        def extractFile(item):
+            filename, expected = item
+            tempPath = f"{fileManager.getFilePath(filename)}.restore.tmp"
+            try:
+                size, digest = self.decompressStream(os.path.join(archiveDir, filename + self.METHODS[method]), tempPath, method)
+            except (OSError, zlib.error, lzma.LZMAError) as e:
+                return filename, tempPath, f"unreadable ({e})"
+            if size != expected["size"] or digest != expected["sha256"]:
+                return filename, tempPath, "checksum mismatch"
+            return filename, tempPath, None
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            extracted = list(pool.map(extractFile, manifest["files"].items()))
+
+        failures = [(filename, error) for filename, _, error in extracted if error]
+        if failures:
+            for _, tempPath, _ in extracted:
+                if os.path.exists(tempPath):
+                    os.remove(tempPath)
+            return False, failures, manifest, time.perf_counter() - started
+
+        for filename, tempPath, _ in extracted:
+            fileManager.installFile(filename, tempPath)
+
+        return True, [], manifest, time.perf_counter() - started
@@ -1,30 +1,88 @@
 import os
 import threading
 import datetime
-import shutil
+import time
+from contextlib import contextmanager
+from DataManagement.TableCache import TableCache
+from DataManagement.RecordIndex import RecordIndex
+from DataManagement.TrigramIndex import TrigramIndex
+from DataManagement.EnrollmentIndex import EnrollmentIndex
+from DataManagement.WaitlistIndex import WaitlistIndex
+from DataManagement.SequenceAllocator import SequenceAllocator
+from DataManagement.Journal import TableJournal, mergeEntries, adjustLine
+from DataManagement.FileLock import FileLock
+from DataManagement.LogWriter import LogWriter
+from DataManagement.Backups import SnapshotBackup, ArchiveBackup
+from DataManagement.SqliteBackend import SqliteBackend
 
 class DataManagement:
-    def __init__(self, baseDirectory="Data/", backUpFolder="Data-Bak/", reportsFolder = "Reports/"):
+    #camper.txt: id:name:age:dob:parentID:medical
+    CAMPER_FIELDS = (str, str, int, str, str, str)
+
+    def __init__(self, baseDirectory="Data/", backUpFolder="Data-Bak/", reportsFolder = "Reports/", cacheBytes=64 * 1024 * 1024, journaled=False, journalThreshold=256 * 1024, logDurability="async", keepBackups=10, backend="text", databasePath=None):
         self.data_files = [
             "camper.txt",
             "log.txt",
-            "session.txt",
+            "sessions.txt",
+            "session_enrollments.txt",
+            "attendance.txt",
             "summary.txt",
-            "users.txt"
+            "users.txt",
+            "waitlist.txt",
+            "sequences.txt"
         ]
         self.baseDirectory = baseDirectory
         self.backUpFolder = backUpFolder
         self.reportsFolder = reportsFolder
-        self.lock = threading.Lock()
+        self.lock = threading.RLock()
+        self.cache = TableCache(cacheBytes)
+        self.indexes = {
+            "camper.txt": TrigramIndex({"id": 0}, {"parent": 4}, minFields=5, textField=1),
+            "sessions.txt": RecordIndex({"id": 0}, minFields=11),
+            "users.txt": RecordIndex({"id": 0, "username": 2}, {"role": 1}, minFields=4),
+            "session_enrollments.txt": EnrollmentIndex(),
+            "waitlist.txt": WaitlistIndex()
+        }
+        #Tables that support record-level upserts, keyed on the given field
+        self.tableKeys = {
+            "camper.txt": 0,
+            "users.txt": 0,
+            "sessions.txt": 0
+        }
+        self.journaled = journaled
+        self.journalThreshold = journalThreshold
+        self.journals = {}
+        self.compacting = set()
         self.ensureDirectory()
+        self.fileLock = FileLock(self.baseDirectory)
+        self.logWriter = LogWriter(self, "log.txt", logDurability)
+        self.snapshots = SnapshotBackup(self.backUpFolder, keepBackups)
+        self.archives = ArchiveBackup(self.backUpFolder)
+        self.sequences = SequenceAllocator(self)
+
+        #Optional SQLite storage for the core tables; everything else stays as text files
+        self.backend = None
+        if backend == "sqlite":
+            self.backend = SqliteBackend(databasePath or self.getFilePath("happytrails.db"))
+        elif backend != "text":
+            raise ValueError(f"Unknown storage backend '{backend}'")
     
     def logAction(self, id, name, action: str):
         timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         record = f"{id}:{name}:{action}:{timestamp}\n"
-        success = self.write("log.txt", record, append=True)
+        success = self.logWriter.submit(record)
         if not success:
             print("⚠️ Failed to log session.")
 
+    def flush(self):
+        self.logWriter.flush()
+
+    def close(self):
+        self.logWriter.close()
+        #After the log writer, whose thread may hold a connection of its own
+        if self.backend is not None:
+            self.backend.close()
+
     def ensureDirectory(self):
         if not os.path.exists(self.baseDirectory):
             os.makedirs(self.baseDirectory)
@@ -39,48 +97,436 @@ class DataManagement:
             print(f"📁 Created reports directory: {self.reportsFolder}")
 
     def getFilePath(self, filename):
+        if self.backend is not None and filename == self.backend.filename:
+            return self.backend.path
         return os.path.join(self.baseDirectory, filename)
+
+    #Thread + cross-process writer lock for one table. Locks are per table so the
+    #log writer thread can commit while another table is being streamed into.
+    def exclusive(self, filename):
+        return self.fileLock.exclusive(filename)
+
+    def shared(self, filename):
+        return self.fileLock.shared(filename)
+
+    #Yields a path holding a consistent copy of one data file for backups: the
+    #file itself with writers held off, or a backup of the SQLite database
+    @contextmanager
+    def capture(self, filename):
+        if self.backend is not None and filename == self.backend.filename:
+            with self.backend.snapshot() as path:
+                yield path
+            return
+        with self.shared(filename):
+            yield self.getFilePath(filename)
+
+    def usesBackend(self, filename):
+        return self.backend is not None and self.backend.handles(filename)
+
+    def getJournal(self, filename):
+        if not self.journaled or filename not in self.tableKeys or self.usesBackend(filename):
+            return None
+        if filename not in self.journals:
+            self.journals[filename] = TableJournal(self.getFilePath(filename), self.tableKeys[filename])
+        return self.journals[filename]
+
+    #The journal reads must replay: this instance's own, or one left by a
+    #journaled instance sharing the same Data/ directory
+    def replayJournal(self, filename):
+        journal = self.getJournal(filename)
+        if journal is None and filename in self.tableKeys and not self.usesBackend(filename):
+            path = self.getFilePath(filename)
+            if os.path.exists(path + ".journal"):
+                journal = TableJournal(path, self.tableKeys[filename])
+        return journal
+
+    def tableSignature(self, filename):
+        #SQLite commits append to the write-ahead log, so the pair changes on every write
+        if self.usesBackend(filename):
+            return (TableCache.signature(self.backend.path), TableCache.signature(self.backend.path + "-wal"))
+
+        signature = TableCache.signature(self.getFilePath(filename))
+        journal = self.replayJournal(filename)
+        if journal is None:
+            return signature
+        return (signature, TableCache.signature(journal.path))
     
     def read(self, filename):
         path = self.getFilePath(filename)
         self.ensureFileExists(path)
 
+        #Make sure queued log records are on disk before reading them back
+        if filename == self.logWriter.filename:
+            self.logWriter.flush()
+
+        if self.usesBackend(filename):
+            return self.backend.read(filename)
+
+        #Serve from cache while the file (and its journal) is unchanged on disk
+        signature = self.tableSignature(filename)
+        cached = self.cache.get(path, signature)
+        if cached is not None:
+            return list(cached)
+
         try:
-            with open(path, "r", encoding="utf-8") as file:
-                lines = file.readlines()
-            return [line.strip() for line in lines if line.strip()]
+            with self.shared(filename):
+                signature = self.tableSignature(filename)
+                with open(path, "r", encoding="utf-8") as file:
+                    lines = [line.strip() for line in file]
+                lines = [line for line in lines if line]
+
+                journal = self.replayJournal(filename)
+                if journal is not None:
+                    lines = journal.replay(lines)
+
+            self.cache.put(path, signature, lines)
+            return lines
         
         except Exception as e:
             print(f"⚠️ Error reading {filename}: {e}")
             self.recoverCorruptedFile(path)
             return []
     
-    def write(self, filename, data, append=False):
+    def iterLines(self, filename):
         path = self.getFilePath(filename)
         self.ensureFileExists(path)
-        mode = "a" if append else "w"
 
-        with self.lock:
+        if filename == self.logWriter.filename:
+            self.logWriter.flush()
+
+        if self.usesBackend(filename):
+            yield from self.backend.iterLines(filename)
+            return
+
+        #Journaled tables only exist as a merged view
+        if self.replayJournal(filename) is not None:
+            yield from self.read(filename)
+            return
+
+        cached = self.cache.get(path, self.tableSignature(filename))
+        if cached is not None:
+            yield from cached
+            return
+
+        #Rewrites are atomic renames and appends are whole lines, so the open
+        #handle stays a consistent snapshot after the lock is released
+        with self.shared(filename):
+            file = open(path, "r", encoding="utf-8")
+
+        with file:
+            for line in file:
+                line = line.strip()
+                if line:
+                    yield line
+
+    def iterRecords(self, filename, fields=None, predicate=None):
+        for line in self.iterLines(filename):
+            if fields:
+                #The last field keeps any remaining colons (e.g. timestamps)
+                parts = line.split(":", len(fields) - 1)
+                if len(parts) < len(fields):
+                    continue
+                try:
+                    record = tuple(convert(value) for convert, value in zip(fields, parts))
+                except ValueError:
+                    continue
+            else:
+                record = tuple(line.split(":"))
+
+            if predicate is None or predicate(record):
+                yield record
+
+    def write(self, filename, data, append=False, durable=False):
+        path = self.getFilePath(filename)
+        self.ensureFileExists(path)
+        journal = self.getJournal(filename)
+
+        if isinstance(data, str):
+            lines = data.splitlines() or [data]
+        elif append or journal is not None or filename in self.indexes or self.usesBackend(filename):
+            lines = list(data)
+        else:
+            #Plain full rewrites (reports) are streamed straight into the temp file
+            lines = data
+
+        if self.usesBackend(filename):
             try:
-                with open(path, mode, encoding="utf-8") as file:
-                    if isinstance(data, list):
-                        for line in data:
-                            file.write(line if line.endswith("\n") else f"{line}\n")
-                    else:
-                        file.write(data if data.endswith("\n") else f"{data}\n")
+                if append:
+                    self.backend.append(filename, lines)
+                else:
+                    self.backend.replaceAll(filename, lines)
                 return True
             except Exception as e:
                 print(f"❌ Write failed for {filename}: {e}")
                 return False
 
+        #Appends to a journaled table become upserts in its journal
+        if journal is not None and append:
+            entries = [("U", journal.keyOf(line.strip()), line.strip()) for line in lines if line.strip()]
+            return self.applyChanges(filename, entries)
+
+        with self.exclusive(filename):
+            #A plain append changes the base file, which would orphan a journal left
+            #by a journaled instance, so its entries are folded into the base first
+            pending = self.replayJournal(filename)
+            if append and pending is not None and pending.entries():
+                self.compact(filename)
+
+            before = self.tableSignature(filename)
+            try:
+                if append:
+                    #One write call so concurrent appenders never interleave lines
+                    with open(path, "a", encoding="utf-8") as file:
+                        file.write("".join(line if line.endswith("\n") else f"{line}\n" for line in lines))
+                        if durable:
+                            file.flush()
+                            os.fsync(file.fileno())
+                else:
+                    self.replaceFile(path, lines)
+                if pending is not None:
+                    pending.reset()
+                success = True
+            except Exception as e:
+                print(f"❌ Write failed for {filename}: {e}")
+                success = False
+            finally:
+                self.cache.invalidate(path)
+
+            after = self.tableSignature(filename)
+            if not success:
+                self.updateIndex(filename, before, after, None)
+            elif append:
+                self.updateIndex(filename, before, after, lambda index: index.addLines(lines))
+            elif filename in self.indexes:
+                self.indexes[filename].build(lines, after)
+            return success
+
+    def upsert(self, filename, record):
+        line = record.strip()
+        key = line.split(":")[self.tableKeys[filename]]
+        return self.applyChanges(filename, [("U", key, line)])
+
+    def delete(self, filename, key):
+        return self.applyChanges(filename, [("D", key, None)])
+
+    #Adds delta to one numeric field of a record; journaled tables store just the delta
+    def adjustField(self, filename, key, fieldIndex, delta):
+        return self.adjustFields(filename, [(key, fieldIndex, delta)])
+
+    def adjustFields(self, filename, adjustments):
+        return self.applyChanges(filename, [("C", key, (fieldIndex, delta)) for key, fieldIndex, delta in adjustments])
+
+    def applyChanges(self, filename, entries):
+        path = self.getFilePath(filename)
+        journal = self.getJournal(filename)
+
+        if self.usesBackend(filename):
+            try:
+                self.backend.applyChanges(filename, entries)
+                return True
+            except Exception as e:
+                print(f"❌ Write failed for {filename}: {e}")
+                return False
+
+        #Without a journal the change is folded into a full rewrite
+        if journal is None:
+            with self.exclusive(filename):
+                lines = mergeEntries(self.read(filename), entries, self.tableKeys[filename])
+                return self.write(filename, lines, append=False)
+
+        self.ensureFileExists(path)
+        with self.exclusive(filename):
+            before = self.tableSignature(filename)
+            try:
+                journal.append(entries)
+                success = True
+            except Exception as e:
+                print(f"❌ Write failed for {filename}: {e}")
+                success = False
+            finally:
+                self.cache.invalidate(path)
+
+            def change(index):
+                for op, key, line in entries:
+                    if op == "D":
+                        index.remove(key)
+                    elif op == "C":
+                        current = index.lookup(index.primary, key)
+                        if current is not None:
+                            index.upsert(tuple(adjustLine(":".join(current), *line).split(":")))
+                    else:
+                        parts = index.parse(line)
+                        if parts is not None:
+                            index.upsert(parts)
+
+            self.updateIndex(filename, before, self.tableSignature(filename), change if success else None)
+
+        if success and journal.size() > self.journalThreshold:
+            self.scheduleCompaction(filename)
+        return success
+
+    def scheduleCompaction(self, filename):
+        with self.lock:
+            if filename in self.compacting:
+                return
+            self.compacting.add(filename)
+
+        def run():
+            try:
+                self.compact(filename)
+            finally:
+                with self.lock:
+                    self.compacting.discard(filename)
+
+        threading.Thread(target=run, name=f"compact-{filename}", daemon=True).start()
+
+    def compact(self, filename):
+        journal = self.replayJournal(filename)
+        if journal is None:
+            return False
+
+        path = self.getFilePath(filename)
+        with self.exclusive(filename):
+            before = self.tableSignature(filename)
+            lines = self.read(filename)
+            try:
+                #Base is swapped in atomically, then the journal is restarted against it
+                self.replaceFile(path, lines)
+                journal.reset()
+            except Exception as e:
+                print(f"❌ Compaction failed for {filename}: {e}")
+                return False
+            finally:
+                self.cache.invalidate(path)
+
+            self.updateIndex(filename, before, self.tableSignature(filename), lambda index: None)
+            return True
+
+    def compactAll(self):
+        for filename in self.tableKeys:
+            journal = self.replayJournal(filename)
+            if journal is not None and journal.size() > len(journal.header()):
+                self.compact(filename)
+
+    #Write-to-temp + fsync + rename, so readers only ever see a complete file
+    def replaceFile(self, path, lines):
+        tempPath = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tempPath, "w", encoding="utf-8") as file:
+                for line in lines:
+                    file.write(line if line.endswith("\n") else f"{line}\n")
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(tempPath, path)
+        except BaseException:
+            if os.path.exists(tempPath):
+                os.remove(tempPath)
+            raise
+        self.syncDirectory(os.path.dirname(path))
+
+    def syncDirectory(self, directory):
+        try:
+            fd = os.open(directory or ".", os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+    def updateIndex(self, filename, before, after, change):
+        index = self.indexes.get(filename)
+        if index is None:
+            return
+
+        #Only patch an index that was current right before this write
+        if change is None or index.signature != before:
+            index.signature = None
+            return
+
+        change(index)
+        index.signature = after
+
+    def getIndex(self, filename):
+        index = self.indexes[filename]
+        signature = self.tableSignature(filename)
+        if index.signature is None or index.signature != signature:
+            index.build(self.read(filename), signature)
+        return index
+
+    def findRecord(self, filename, field, value):
+        if self.usesBackend(filename):
+            return self.backend.findOne(filename, field, value)
+        return self.getIndex(filename).lookup(field, value)
+
+    #One indexed fetch, typed the same way as iterRecords(fields=CAMPER_FIELDS)
+    def findCamper(self, camper_id):
+        return self.camperRecord(self.findRecord("camper.txt", "id", camper_id))
+
+    def camperRecord(self, parts):
+        if not parts or len(parts) < len(self.CAMPER_FIELDS) - 1:
+            return None
+        #The medical field may itself contain colons
+        parts = tuple(parts[:5]) + (":".join(parts[5:]),)
+        try:
+            return tuple(convert(value) for convert, value in zip(self.CAMPER_FIELDS, parts))
+        except ValueError:
+            return None
+
+    #Ranked name search: exact, prefix, word prefix and substring matches, then close misspellings
+    def searchCampers(self, query, limit=None):
+        index = self.getIndex("camper.txt")
+        records = (self.camperRecord(index.lookup("id", key)) for key, _, _ in index.search(query, limit))
+        return [record for record in records if record]
+
+    def findGroup(self, filename, group, value):
+        if self.usesBackend(filename):
+            return self.backend.findMany(filename, group, value)
+        return self.getIndex(filename).group(group, value)
+
+    def recordCount(self, filename):
+        if self.usesBackend(filename):
+            return self.backend.count(filename)
+        return len(self.getIndex(filename))
+
+    def findUser(self, username):
+        if self.usesBackend("users.txt"):
+            return self.backend.findOne("users.txt", "username", username)
+
+        return self.getIndex("users.txt").lookup("username", username)
+
+    def isEnrolled(self, session_id, camper_id):
+        if self.usesBackend("session_enrollments.txt"):
+            return self.backend.isEnrolled(session_id, camper_id)
+
+        return self.getIndex("session_enrollments.txt").contains(session_id, camper_id)
+
+    def migrateToSqlite(self, databasePath=None, force=False):
+        backend = self.backend or SqliteBackend(databasePath or self.getFilePath("happytrails.db"))
+        source = self.backend
+        self.backend = None
+        try:
+            return backend.migrate(self, force=force)
+        finally:
+            self.backend = source
+            if source is None:
+                backend.close()
+
+    def cacheStats(self):
+        return self.cache.stats()
+
     def ensureFileExists(self, path):
         if not os.path.exists(path):
-            with open(path, "w", encoding="utf-8") as f:
+            #Append mode never truncates a file another process just created
+            with open(path, "a", encoding="utf-8") as f:
                 pass
             print(f"📝 Created new data file: {os.path.basename(path)}")
     
     def recoverCorruptedFile(self, path):
         corruptedPath = path + ".corrupted"
+        self.cache.invalidate(path)
         try:
             os.rename(path, corruptedPath)
             print(f"⚠️ Corrupted file renamed to {os.path.basename(corruptedPath)}.")
@@ -91,26 +537,39 @@ class DataManagement:
     
     def exportSummary(self, summaryFile="summary.txt"):
         summaryPath = self.getFilePath(summaryFile)
-        with self.lock:
+        self.flush()
+
+        def sections():
+            yield "==== SYSTEM DATA SUMMARY ====\n"
+            yield "\n"
+            filenames = list(os.listdir(self.baseDirectory))
+            if self.backend is not None:
+                filenames = [f for f in filenames if not f.startswith(self.backend.filename)]
+                filenames += [f for f in self.backend.tables() if f not in filenames]
+
+            for filename in filenames:
+                path = self.getFilePath(filename)
+                if (filename == summaryFile or filename.startswith(".") or filename.endswith((".journal", ".tmp"))
+                        or not (os.path.isfile(path) or self.usesBackend(filename))):
+                    continue
+                yield f"--- {filename} ---\n"
+                try:
+                    for line in self.iterLines(filename):
+                        yield f"{line}\n"
+                except Exception as e:
+                    yield f"[Error reading {filename}: {e}]\n"
+                yield "\n"
+
+        with self.exclusive(summaryFile):
             try:
-                with open(summaryPath, "w", encoding="utf-8") as summary:
-                    summary.write("==== SYSTEM DATA SUMMARY ====\n\n")
-                    for filename in os.listdir(self.baseDirectory):
-                        if filename == summaryFile:
-                            continue
-                        path = self.getFilePath(filename)
-                        summary.write(f"--- {filename} ---\n")
-                        try:
-                            with open(path, "r", encoding="utf-8") as f:
-                                summary.writelines(f.readlines())
-                        except Exception as e:
-                            summary.write(f"[Error reading {filename}: {e}]\n")
-                        summary.write("\n")
+                self.replaceFile(summaryPath, sections())
                 print(f"✅ Summary exported successfully to {summaryFile}.")
                 return True
             except Exception as e:
                 print(f"❌ Export summary failed: {e}")
                 return False
+            finally:
+                self.cache.invalidate(summaryPath)
     
     def createReport(self, sourceFilename, filteredLines):
         dateStr = datetime.datetime.now().strftime("%m.%d.%y")
@@ -134,16 +593,12 @@ class DataManagement:
         eligible_only=False,
         logic="AND"
     ):
-        records = self.read("camper.txt")
-        results = []
-
-        for line in records:
-            parts = line.split(":")
-            if len(parts) < 5:
-                continue
+        if self.usesBackend("camper.txt"):
+            return self.backend.queryCampers(camper_id, parent_id, name, min_age, max_age, eligible_only, logic)
 
-            c_id, c_name, c_age, c_parent, c_med = parts
-            c_age = int(c_age)
+        #Checks run inside the scan, so only matching campers are ever kept
+        def matches(record):
+            c_id, c_name, c_age, c_dob, c_parent, c_med = record
 
             checks = []
 
@@ -166,30 +621,120 @@ class DataManagement:
                 checks.append(6 <= c_age <= 17)
 
             #Apply logic
-            if logic == "AND" and all(checks):
-                results.append(line)
-            elif logic == "OR" and any(checks):
-                results.append(line)
+            if logic == "AND":
+                return all(checks)
+            return logic == "OR" and any(checks)
 
-        return results
+        #With AND, a name narrows the scan to the trigram index's substring matches
+        if name and logic == "AND":
+            index = self.getIndex("camper.txt")
+            records = (self.camperRecord(index.lookup("id", key)) for key in index.contains(name))
+            records = (record for record in records if record and matches(record))
+        else:
+            records = self.iterRecords("camper.txt", fields=self.CAMPER_FIELDS, predicate=matches)
+        return [":".join(map(str, record)) for record in records]
     
     def backupAll(self):
         print("\n📁 Starting backup process...")
+        self.flush()
+        self.compactAll()
+        started = time.perf_counter()
 
-        for filename in self.data_files:
-            source_path = os.path.join(self.baseDirectory, filename)
-            backup_name = filename.replace(".txt", ".bak.txt")
-            backup_path = os.path.join(self.backUpFolder, backup_name)
+        try:
+            name, results = self.snapshots.create(self, self.backupFiles())
+        except Exception as e:
+            print(f"❌ Backup failed: {e}")
+            return None
 
-            if not os.path.exists(source_path):
+        for filename, status, copied in results:
+            if status == "missing":
                 print(f"⚠️ Skipped missing file: {filename}")
-                continue
+            elif status == "unchanged":
+                print(f"✅ {filename}: unchanged, linked from previous snapshot")
+            elif status == "appended":
+                print(f"✅ {filename}: copied {copied} new bytes")
+            else:
+                print(f"✅ {filename}: copied {copied} bytes")
+
+        print(f"🎉 Backup completed successfully → {name} ({time.perf_counter() - started:.2f}s).\n")
+        return name
+
+    def archiveAll(self, method="zlib"):
+        print(f"\n🗜️ Creating {method} archive...")
+        self.flush()
+        self.compactAll()
+
+        try:
+            name, manifest, elapsed = self.archives.create(self, self.backupFiles(), method)
+        except Exception as e:
+            print(f"❌ Archive failed: {e}")
+            return None
+
+        rawBytes = sum(f["size"] for f in manifest["files"].values())
+        packedBytes = sum(f["compressedSize"] for f in manifest["files"].values())
+        for filename, entry in manifest["files"].items():
+            print(f"✅ {filename}: {entry['size']} → {entry['compressedSize']} bytes")
+
+        print(f"🎉 Archive {name} created: {rawBytes} → {packedBytes} bytes in {elapsed:.2f}s "
+              f"({self.throughput(rawBytes, elapsed)}).\n")
+        return name
 
-            if os.path.exists(backup_path):
-                os.remove(backup_path)
+    def listArchives(self):
+        return self.archives.archives()
 
-            shutil.copyfile(source_path, backup_path)
+    def restoreArchive(self, name=None):
+        archives = self.listArchives()
+        if not archives:
+            print("⚠️ No archives found to restore.")
+            return False
+
+        name = name or archives[-1]
+        if name not in archives:
+            print(f"❌ Archive '{name}' not found.")
+            return False
+
+        print(f"\n♻️ Restoring from {name}...")
+        self.flush()
+
+        try:
+            success, failures, manifest, elapsed = self.archives.restore(self, name)
+        except Exception as e:
+            print(f"❌ Restore failed: {e}")
+            return False
+
+        if not success:
+            for filename, error in failures:
+                print(f"❌ {filename}: {error}")
+            print("❌ Restore aborted; no files were changed.")
+            return False
+
+        rawBytes = sum(f["size"] for f in manifest["files"].values())
+        for filename in manifest["files"]:
+            print(f"✅ Restored {filename}")
+        print(f"🎉 Restore completed: {rawBytes} bytes in {elapsed:.2f}s ({self.throughput(rawBytes, elapsed)}).\n")
+        return True
+
+    def backupFiles(self):
+        if self.backend is None:
+            return list(self.data_files)
+        return [f for f in self.data_files if not self.usesBackend(f)] + [self.backend.filename]
+
+    def installFile(self, filename, tempPath):
+        path = self.getFilePath(filename)
+        if self.backend is not None and filename == self.backend.filename:
+            self.backend.replaceDatabase(tempPath)
+            return
 
-            print(f"✅ Backed up {filename} → {backup_name}")
+        with self.exclusive(filename):
+            os.replace(tempPath, path)
+            journal = self.replayJournal(filename)
+            if journal is not None:
+                journal.reset()
+            self.cache.invalidate(path)
+            if filename in self.indexes:
+                self.indexes[filename].signature = None
+        self.syncDirectory(os.path.dirname(path))
 
-        print("🎉 Backup completed successfully.\n")
\ No newline at end of file
+    @staticmethod
+    def throughput(byteCount, seconds):
+        return f"{byteCount / max(seconds, 1e-9) / (1024 * 1024):.1f} MB/s"
@@ -0,0 +1,57 @@
+class EnrollmentIndex:
+    #session -> {camper: record} and camper -> {session: record}; the inner
+    #dicts act as insertion-ordered sets, so rosters keep file order.
+    def __init__(self, minFields=2):
+        self.minFields = minFields
+        self.signature = None
+        self.clear()
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        self.bySession = {}
+        self.byCamper = {}
+        self.count = 0
+
+    def build(self, lines, signature):
+        self.clear()
+        self.addLines(lines)
+        self.signature = signature
+
+    def parse(self, line):
+        line = line.strip()
+        if not line:
+            return None
+        parts = tuple(line.split(":", 3))
+        if len(parts) < self.minFields:
+            return None
+        return parts
+
+    def addLines(self, lines):
+        for line in lines:
+            parts = self.parse(line)
+            if parts is not None:
+                self.add(parts)
+
+    def add(self, parts):
+        session_id, camper_id = parts[0], parts[1]
+        campers = self.bySession.setdefault(session_id, {})
+        if camper_id not in campers:
+            self.count += 1
+        campers[camper_id] = parts
+        self.byCamper.setdefault(camper_id, {})[session_id] = parts
+
+    def contains(self, session_id, camper_id):
+        return camper_id in self.bySession.get(session_id, ())
+
+    def lookup(self, name, value):
+        members = self.group(name, value)
+        return members[0] if members else None
+
+    def group(self, name, value):
+        if name == "session":
+            return list(self.bySession.get(value, {}).values())
+        if name == "camper":
+            return list(self.byCamper.get(value, {}).values())
+        raise KeyError(name)
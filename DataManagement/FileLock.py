@@ -0,0 +1,94 @@
+import os
+import threading
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:
+    #No flock on this platform: locks only coordinate threads of this process
+    fcntl = None
+
+class FileLock:
+    def __init__(self, baseDirectory):
+        self.lockDirectory = os.path.join(baseDirectory, ".locks")
+        self.local = threading.local()
+        self.fallbackLocks = {}
+        self.fallbackGuard = threading.Lock()
+        os.makedirs(self.lockDirectory, exist_ok=True)
+
+    def lockPath(self, name):
+        return os.path.join(self.lockDirectory, f"{name}.lock")
+
+    def held(self):
+        if not hasattr(self.local, "held"):
+            self.local.held = {}
+        return self.local.held
+
+    @contextmanager
+    def shared(self, name):
+        self.acquire(name, exclusive=False)
+        try:
+            yield
+        finally:
+            self.release(name)
+
+    @contextmanager
+    def exclusive(self, name):
+        self.acquire(name, exclusive=True)
+        try:
+            yield
+        finally:
+            self.release(name)
+
+    #Locks are re-entrant per thread; a nested shared request under an
+    #exclusive hold is a no-op, and a nested exclusive request upgrades.
+    def acquire(self, name, exclusive):
+        held = self.held()
+        entry = held.get(name)
+
+        if entry is not None:
+            if exclusive and not entry["exclusive"]:
+                if fcntl is not None:
+                    fcntl.flock(entry["handle"], fcntl.LOCK_EX)
+                entry["exclusive"] = True
+            entry["depth"] += 1
+            return
+
+        handle = self.openHandle(name)
+        try:
+            self.lockHandle(handle, exclusive)
+        except BaseException:
+            self.closeHandle(handle)
+            raise
+        held[name] = {"handle": handle, "exclusive": exclusive, "depth": 1}
+
+    def release(self, name):
+        held = self.held()
+        entry = held[name]
+        entry["depth"] -= 1
+        if entry["depth"] == 0:
+            del held[name]
+            self.unlockHandle(entry["handle"])
+            self.closeHandle(entry["handle"])
+
+    def openHandle(self, name):
+        if fcntl is None:
+            with self.fallbackGuard:
+                return self.fallbackLocks.setdefault(name, threading.RLock())
+        return os.open(self.lockPath(name), os.O_RDWR | os.O_CREAT, 0o644)
+
+    def lockHandle(self, handle, exclusive):
+        if fcntl is None:
+            handle.acquire()
+            return
+        fcntl.flock(handle, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+
+    def unlockHandle(self, handle):
+        if fcntl is None:
+            handle.release()
+            return
+        fcntl.flock(handle, fcntl.LOCK_UN)
+
+    def closeHandle(self, handle):
+        if fcntl is not None:
+            os.close(handle)
@@ -0,0 +1,130 @@
+import os
+from collections import OrderedDict
+
+#Entries are ("U", key, line) upserts, ("D", key, None) deletes and
+#("C", key, (field, delta)) counter adjustments to one numeric field.
+def mergeEntries(lines, entries, keyField=0):
+    merged = OrderedDict()
+    for position, line in enumerate(lines):
+        parts = line.split(":")
+        key = parts[keyField] if len(parts) > keyField else ("#", position)
+        merged[key] = line
+
+    for op, key, value in entries:
+        if op == "U":
+            merged[key] = value
+        elif op == "C":
+            if key in merged:
+                merged[key] = adjustLine(merged[key], *value)
+        else:
+            merged.pop(key, None)
+
+    return list(merged.values())
+
+def adjustLine(line, field, delta):
+    body = line.rstrip("\n")
+    parts = body.split(":")
+    #A counter that older records were written without starts from zero
+    if field == len(parts):
+        parts.append("0")
+    try:
+        parts[field] = str(int(parts[field] or 0) + delta)
+    except (IndexError, ValueError):
+        return line
+    return ":".join(parts) + line[len(body):]
+
+
+class TableJournal:
+    def __init__(self, basePath, keyField=0):
+        self.basePath = basePath
+        self.path = basePath + ".journal"
+        self.keyField = keyField
+
+    #The header ties the journal to one version of the base file, so a journal
+    #left behind by an interrupted compaction is never replayed twice.
+    def baseIdentity(self):
+        try:
+            st = os.stat(self.basePath)
+        except OSError:
+            return "missing"
+        return f"{st.st_ino}:{st.st_size}:{st.st_mtime_ns}"
+
+    def header(self):
+        return f"BASE\t{self.baseIdentity()}\n"
+
+    def keyOf(self, line):
+        parts = line.split(":")
+        if len(parts) <= self.keyField:
+            return None
+        return parts[self.keyField]
+
+    def entries(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                first = file.readline()
+                if first != self.header():
+                    return []
+
+                entries = []
+                for line in file:
+                    #A torn final line from a crash is ignored
+                    if not line.endswith("\n"):
+                        break
+                    parts = line.rstrip("\n").split("\t", 2)
+                    if parts[0] == "U" and len(parts) == 3:
+                        entries.append(("U", parts[1], parts[2]))
+                    elif parts[0] == "D" and len(parts) >= 2:
+                        entries.append(("D", parts[1], None))
+                    elif parts[0] == "C" and len(parts) == 3:
+                        try:
+                            field, delta = parts[2].split("\t")
+                            entries.append(("C", parts[1], (int(field), int(delta))))
+                        except ValueError:
+                            continue
+                return entries
+        except FileNotFoundError:
+            return []
+
+    def replay(self, baseLines):
+        entries = self.entries()
+        if not entries:
+            return baseLines
+        return mergeEntries(baseLines, entries, self.keyField)
+
+    def append(self, entries):
+        fresh = True
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                fresh = file.readline() != self.header()
+        except FileNotFoundError:
+            pass
+
+        if fresh:
+            self.reset()
+
+        with open(self.path, "a", encoding="utf-8") as file:
+            for op, key, value in entries:
+                if op == "U":
+                    record = value.rstrip("\n")
+                    file.write(f"U\t{key}\t{record}\n")
+                elif op == "C":
+                    field, delta = value
+                    file.write(f"C\t{key}\t{field}\t{delta}\n")
+                else:
+                    file.write(f"D\t{key}\n")
+            file.flush()
+            os.fsync(file.fileno())
+
+    def reset(self):
+        tempPath = f"{self.path}.{os.getpid()}.tmp"
+        with open(tempPath, "w", encoding="utf-8") as file:
+            file.write(self.header())
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tempPath, self.path)
+
+    def size(self):
+        try:
+            return os.path.getsize(self.path)
+        except OSError:
+            return 0
@@ -0,0 +1,127 @@
+import atexit
+import queue
+import threading
+import time
+
+class LogWriter:
+    #async: batched in the background, handed to the OS on each commit
+    #fsync: batched in the background, each commit is fsynced before flush() returns
+    #sync:  no background thread, every record is written and fsynced immediately
+    MODES = ("async", "fsync", "sync")
+    STOP = object()
+
+    def __init__(self, fileManager, filename="log.txt", durability="async", batchSize=256, flushInterval=0.5, maxQueue=10000):
+        if durability not in self.MODES:
+            raise ValueError(f"Unknown durability mode '{durability}'")
+
+        self.fileManager = fileManager
+        self.filename = filename
+        self.durability = durability
+        self.batchSize = batchSize
+        self.flushInterval = flushInterval
+        self.queue = queue.Queue(maxsize=maxQueue)
+        self.thread = None
+        self.closed = False
+        self.registered = False
+        self.lock = threading.Lock()
+        self.committedBatches = 0
+        self.committedRecords = 0
+
+    def submit(self, record):
+        if self.durability == "sync" or self.closed:
+            return self.fileManager.write(self.filename, record, append=True, durable=True)
+
+        self.start()
+        #Blocks when the queue is full, which throttles producers to disk speed
+        self.queue.put(record)
+        return True
+
+    def start(self):
+        with self.lock:
+            if self.thread is not None and self.thread.is_alive():
+                return
+            self.thread = threading.Thread(target=self.run, name="log-writer", daemon=True)
+            self.thread.start()
+            #Once per writer; close() unregisters it so closed writers are not kept alive until exit
+            if not self.registered:
+                atexit.register(self.close)
+                self.registered = True
+
+    def run(self):
+        batch = []
+        deadline = None
+
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                item = self.queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if isinstance(item, str):
+                if not batch:
+                    deadline = time.monotonic() + self.flushInterval
+                batch.append(item)
+                if len(batch) < self.batchSize:
+                    continue
+
+            self.commit(batch)
+            batch = []
+            deadline = None
+
+            if item is self.STOP:
+                return
+            if isinstance(item, threading.Event):
+                item.set()
+
+    def commit(self, batch):
+        if not batch:
+            return
+        if self.fileManager.write(self.filename, batch, append=True, durable=self.durability == "fsync"):
+            self.committedBatches += 1
+            self.committedRecords += len(batch)
+        else:
+            print(f"⚠️ Failed to write {len(batch)} log record(s).")
+
+    def running(self):
+        return self.thread is not None and self.thread.is_alive()
+
+    def flush(self):
+        if not self.running():
+            return
+        done = threading.Event()
+        self.queue.put(done)
+        done.wait()
+
+    def setDurability(self, durability):
+        if durability not in self.MODES:
+            raise ValueError(f"Unknown durability mode '{durability}'")
+        self.flush()
+        self.durability = durability
+
+    def close(self):
+        with self.lock:
+            if self.closed:
+                return
+            self.closed = True
+            thread = self.thread
+            if self.registered:
+                atexit.unregister(self.close)
+                self.registered = False
+
+        if thread is not None and thread.is_alive():
+            self.queue.put(self.STOP)
+            thread.join()
+
+        #Records that raced with shutdown are written directly
+        leftovers = []
+        while True:
+            try:
+                item = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(item, str):
+                leftovers.append(item)
+            elif isinstance(item, threading.Event):
+                item.set()
+        self.commit(leftovers)
@@ -0,0 +1,92 @@
+class RecordIndex:
+    def __init__(self, uniqueFields, groupFields=None, minFields=1):
+        #The first unique field is the record's primary key
+        self.uniqueFields = dict(uniqueFields)
+        self.groupFields = dict(groupFields or {})
+        self.minFields = minFields
+        self.primary = next(iter(self.uniqueFields))
+        self.signature = None
+        self.clear()
+
+    def __len__(self):
+        return len(self.unique[self.primary])
+
+    def clear(self):
+        self.records = []
+        self.unique = {name: {} for name in self.uniqueFields}
+        self.groups = {name: {} for name in self.groupFields}
+
+    def build(self, lines, signature):
+        self.clear()
+        self.addLines(lines)
+        self.signature = signature
+
+    def parse(self, line):
+        line = line.strip()
+        if not line:
+            return None
+        parts = tuple(line.split(":"))
+        if len(parts) < self.minFields:
+            return None
+        return parts
+
+    def addLines(self, lines):
+        for line in lines:
+            parts = self.parse(line)
+            if parts is not None:
+                self.upsert(parts)
+
+    def upsert(self, parts):
+        key = parts[self.uniqueFields[self.primary]]
+        offset = self.unique[self.primary].get(key)
+
+        if offset is None:
+            offset = len(self.records)
+            self.records.append(parts)
+        else:
+            self.unlink(offset)
+            self.records[offset] = parts
+
+        self.link(offset)
+
+    def remove(self, key):
+        offset = self.unique[self.primary].get(key)
+        if offset is None:
+            return
+        self.unlink(offset)
+        self.records[offset] = None
+
+    def link(self, offset):
+        parts = self.records[offset]
+        key = parts[self.uniqueFields[self.primary]]
+
+        for name, field in self.uniqueFields.items():
+            self.unique[name][parts[field]] = offset
+
+        for name, field in self.groupFields.items():
+            self.groups[name].setdefault(parts[field], {})[key] = None
+
+    def unlink(self, offset):
+        parts = self.records[offset]
+        key = parts[self.uniqueFields[self.primary]]
+
+        for name, field in self.uniqueFields.items():
+            if self.unique[name].get(parts[field]) == offset:
+                del self.unique[name][parts[field]]
+
+        for name, field in self.groupFields.items():
+            members = self.groups[name].get(parts[field])
+            if members is not None:
+                members.pop(key, None)
+                if not members:
+                    del self.groups[name][parts[field]]
+
+    def lookup(self, name, value):
+        offset = self.unique[name].get(value)
+        if offset is None:
+            return None
+        return self.records[offset]
+
+    def group(self, name, value):
+        members = self.groups[name].get(value, {})
+        return [self.lookup(self.primary, key) for key in members]
@@ -0,0 +1,71 @@
+#prefix -> (table the IDs live in, number offset, zero-padded width, first number)
+#  ADM_0, STF_0, PRT_0   users.txt
+#  CMP0001               camper.txt
+#  S1000000              sessions.txt
+SEQUENCES = {
+    "ADM_": ("users.txt", 0, 0, 0),
+    "STF_": ("users.txt", 0, 0, 0),
+    "PRT_": ("users.txt", 0, 0, 0),
+    "CMP": ("camper.txt", 0, 4, 1),
+    "S": ("sessions.txt", 1000000, 0, 0)
+}
+
+class SequenceAllocator:
+    #sequences.txt keeps one PREFIX:next line per prefix, the next number to hand
+    #out, so an ID costs one small read and rewrite instead of a table scan.
+    #A prefix missing from the file is seeded once from the highest ID in its table.
+    #Lock order: sequences.txt is taken before any table, so never call this
+    #while holding a table's exclusive lock.
+    def __init__(self, fileManager, filename="sequences.txt"):
+        self.fileManager = fileManager
+        self.filename = filename
+
+    def format(self, prefix, number):
+        _, offset, width, _ = self.sequence(prefix)
+        return f"{prefix}{number + offset:0{width}d}"
+
+    def sequence(self, prefix):
+        #Unknown prefixes (e.g. a new role) behave like the user prefixes
+        return SEQUENCES.get(prefix, ("users.txt", 0, 0, 0))
+
+    def load(self):
+        counters = {}
+        for line in self.fileManager.read(self.filename):
+            prefix, _, value = line.rpartition(":")
+            if prefix and value.isdigit():
+                counters[prefix] = int(value)
+        return counters
+
+    def seed(self, prefix):
+        #Next number after the highest ID already in the table
+        table, offset, _, first = self.sequence(prefix)
+        highest = first - 1
+        for line in self.fileManager.iterLines(table):
+            record_id = line.split(":", 1)[0]
+            digits = record_id[len(prefix):]
+            if record_id.startswith(prefix) and digits.isdigit():
+                highest = max(highest, int(digits) - offset)
+        return highest + 1
+
+    def taken(self, prefix, numbers):
+        table = self.sequence(prefix)[0]
+        return any(self.fileManager.findRecord(table, "id", self.format(prefix, n)) for n in numbers)
+
+    def allocate(self, prefix, count=1):
+        #Hands out `count` consecutive IDs. IDs that are never used just leave a gap.
+        with self.fileManager.exclusive(self.filename):
+            counters = self.load()
+            start = counters.get(prefix)
+            #IDs added behind the file's back (a restore, hand edits) trigger a fresh seed
+            if start is None or self.taken(prefix, range(start, start + count)):
+                start = max(start or 0, self.seed(prefix))
+
+            counters[prefix] = start + count
+            lines = [f"{name}:{value}\n" for name, value in sorted(counters.items())]
+            if not self.fileManager.write(self.filename, lines, append=False):
+                raise OSError(f"could not update {self.filename}")
+
+        return [self.format(prefix, n) for n in range(start, start + count)]
+
+    def next(self, prefix):
+        return self.allocate(prefix)[0]
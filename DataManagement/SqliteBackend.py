@@ -0,0 +1,320 @@
+import os
+import sys
+import sqlite3
+import argparse
+import tempfile
+import threading
+from contextlib import contextmanager
+
+#filename -> (table, columns, key column, {lookup name: column}, indexed columns)
+#Column order matches the colon-delimited text format exactly.
+TABLES = {
+    "users.txt": (
+        "users",
+        [("id", "TEXT"), ("role", "TEXT"), ("username", "TEXT"), ("password", "TEXT")],
+        "id",
+        {"id": "id", "username": "username", "role": "role"},
+        ["username", "role"]
+    ),
+    "camper.txt": (
+        "campers",
+        [("id", "TEXT"), ("name", "TEXT"), ("age", "INTEGER"), ("dob", "TEXT"), ("parent_id", "TEXT"), ("medical", "TEXT")],
+        "id",
+        {"id": "id", "parent": "parent_id"},
+        ["parent_id", "age"]
+    ),
+    "sessions.txt": (
+        "sessions",
+        [("session_id", "TEXT"), ("name", "TEXT"), ("activity_type", "TEXT"), ("start_date", "TEXT"),
+         ("end_date", "TEXT"), ("age_group_label", "TEXT"), ("min_age", "INTEGER"), ("max_age", "INTEGER"),
+         ("capacity", "INTEGER"), ("spots_available", "INTEGER"), ("instructor", "TEXT"), ("version", "INTEGER")],
+        "session_id",
+        {"id": "session_id", "instructor": "instructor"},
+        ["instructor"]
+    ),
+    "session_enrollments.txt": (
+        "enrollments",
+        [("session_id", "TEXT"), ("camper_id", "TEXT"), ("camper_name", "TEXT"), ("enrolled_at", "TEXT")],
+        None,
+        {"session": "session_id", "camper": "camper_id"},
+        ["session_id, camper_id", "camper_id"]
+    ),
+    "log.txt": (
+        "log",
+        [("user_id", "TEXT"), ("name", "TEXT"), ("action", "TEXT"), ("logged_at", "TEXT")],
+        None,
+        {"user": "user_id"},
+        ["user_id"]
+    ),
+    "attendance.txt": (
+        "attendance",
+        [("camper_id", "TEXT"), ("name", "TEXT"), ("status", "TEXT"), ("recorded_at", "TEXT")],
+        None,
+        {"camper": "camper_id"},
+        ["camper_id"]
+    )
+}
+
+
+class SqliteBackend:
+    BATCH_SIZE = 5000
+
+    def __init__(self, path):
+        self.path = path
+        self.filename = os.path.basename(path)
+        self.local = threading.local()
+        self.connections = []
+        self.connectionsLock = threading.Lock()
+        self.createSchema()
+
+    #One connection per thread; SQLite's own locking (WAL + busy timeout)
+    #coordinates threads and processes.
+    def connect(self):
+        #Connections stay on their thread; the check is off only so close() can release them all
+        conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def connection(self):
+        conn = getattr(self.local, "conn", None)
+        if conn is None:
+            conn = self.connect()
+            self.local.conn = conn
+            with self.connectionsLock:
+                self.connections.append(conn)
+        return conn
+
+    def createSchema(self):
+        conn = self.connection()
+        with conn:
+            for table, columns, key, _, indexed in TABLES.values():
+                columnSql = ", ".join(f"{name} {kind}" for name, kind in columns)
+                conn.execute(f"CREATE TABLE IF NOT EXISTS {table} (seq INTEGER PRIMARY KEY, {columnSql})")
+                #Columns added since the database was created are appended in place
+                existing = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+                for name, kind in columns:
+                    if name not in existing:
+                        conn.execute(f"ALTER TABLE {table} ADD COLUMN {name} {kind}")
+                if key:
+                    conn.execute(f"CREATE UNIQUE INDEX IF NOT EXISTS idx_{table}_{key} ON {table} ({key})")
+                for column in indexed:
+                    suffix = column.replace(", ", "_")
+                    conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_{suffix} ON {table} ({column})")
+
+    def handles(self, filename):
+        return filename in TABLES
+
+    def tables(self):
+        return list(TABLES)
+
+    #Text line <-> row conversion
+    def toRow(self, filename, line):
+        columns = TABLES[filename][1]
+        parts = line.strip().split(":", len(columns) - 1)
+        parts += [None] * (len(columns) - len(parts))
+        return parts
+
+    @staticmethod
+    def toParts(row):
+        values = list(row)
+        while values and values[-1] is None:
+            values.pop()
+        return tuple("" if v is None else str(v) for v in values)
+
+    @staticmethod
+    def toLine(row):
+        return ":".join(SqliteBackend.toParts(row))
+
+    def selectSql(self, filename):
+        table, columns = TABLES[filename][0], TABLES[filename][1]
+        return f"SELECT {', '.join(name for name, _ in columns)} FROM {table}"
+
+    def insertSql(self, filename):
+        table, columns, key = TABLES[filename][0], TABLES[filename][1], TABLES[filename][2]
+        names = [name for name, _ in columns]
+        sql = f"INSERT INTO {table} ({', '.join(names)}) VALUES ({', '.join('?' for _ in names)})"
+        if key:
+            updates = ", ".join(f"{name} = excluded.{name}" for name in names if name != key)
+            sql += f" ON CONFLICT({key}) DO UPDATE SET {updates}"
+        return sql
+
+    #Line-oriented interface used by the old DataManagement call sites
+    def read(self, filename):
+        rows = self.connection().execute(f"{self.selectSql(filename)} ORDER BY seq")
+        return [self.toLine(row) for row in rows]
+
+    def iterLines(self, filename):
+        #A private connection keeps long scans from pinning this thread's connection
+        conn = self.connect()
+        try:
+            for row in conn.execute(f"{self.selectSql(filename)} ORDER BY seq"):
+                yield self.toLine(row)
+        finally:
+            conn.close()
+
+    def replaceAll(self, filename, lines):
+        conn = self.connection()
+        with conn:
+            conn.execute(f"DELETE FROM {TABLES[filename][0]}")
+            self.insertLines(conn, filename, lines)
+
+    def append(self, filename, lines):
+        conn = self.connection()
+        with conn:
+            self.insertLines(conn, filename, lines)
+
+    def insertLines(self, conn, filename, lines):
+        sql = self.insertSql(filename)
+        batch = []
+        for line in lines:
+            if not line.strip():
+                continue
+            batch.append(self.toRow(filename, line))
+            if len(batch) >= self.BATCH_SIZE:
+                conn.executemany(sql, batch)
+                batch = []
+        if batch:
+            conn.executemany(sql, batch)
+
+    def applyChanges(self, filename, entries):
+        table, columns, key = TABLES[filename][0], TABLES[filename][1], TABLES[filename][2]
+        conn = self.connection()
+        with conn:
+            for op, value, line in entries:
+                if op == "D":
+                    conn.execute(f"DELETE FROM {table} WHERE {key} = ?", (value,))
+                elif op == "C":
+                    column = columns[line[0]][0]
+                    conn.execute(f"UPDATE {table} SET {column} = COALESCE({column}, 0) + ? WHERE {key} = ?", (line[1], value))
+                else:
+                    conn.execute(self.insertSql(filename), self.toRow(filename, line))
+
+    def count(self, filename):
+        return self.connection().execute(f"SELECT COUNT(*) FROM {TABLES[filename][0]}").fetchone()[0]
+
+    #Typed queries that hit the indexes
+    def findOne(self, filename, field, value):
+        column = TABLES[filename][3][field]
+        row = self.connection().execute(f"{self.selectSql(filename)} WHERE {column} = ? ORDER BY seq LIMIT 1", (value,)).fetchone()
+        return self.toParts(row) if row else None
+
+    def findMany(self, filename, field, value):
+        column = TABLES[filename][3][field]
+        rows = self.connection().execute(f"{self.selectSql(filename)} WHERE {column} = ? ORDER BY seq", (value,))
+        return [self.toParts(row) for row in rows]
+
+    def isEnrolled(self, session_id, camper_id):
+        row = self.connection().execute(
+            "SELECT 1 FROM enrollments WHERE session_id = ? AND camper_id = ? LIMIT 1", (session_id, camper_id)).fetchone()
+        return row is not None
+
+    def queryCampers(self, camper_id=None, parent_id=None, name=None, min_age=None, max_age=None, eligible_only=False, logic="AND"):
+        conditions = []
+        params = []
+
+        if camper_id:
+            conditions.append("id = ?")
+            params.append(camper_id)
+        if parent_id:
+            conditions.append("parent_id = ?")
+            params.append(parent_id)
+        if name:
+            conditions.append("instr(lower(name), ?) > 0")
+            params.append(name.lower())
+        if min_age is not None:
+            conditions.append("age >= ?")
+            params.append(min_age)
+        if max_age is not None:
+            conditions.append("age <= ?")
+            params.append(max_age)
+        if eligible_only:
+            conditions.append("age BETWEEN 6 AND 17")
+
+        #Same semantics as the text scan: no checks means all for AND, none for OR
+        if not conditions:
+            if logic != "AND":
+                return []
+            where = ""
+        else:
+            where = " WHERE " + f" {'AND' if logic == 'AND' else 'OR'} ".join(conditions)
+
+        rows = self.connection().execute(f"{self.selectSql('camper.txt')}{where} ORDER BY seq", params)
+        return [self.toLine(row) for row in rows]
+
+    #Backups read a copy made with SQLite's online backup API, which includes
+    #commits still in the write-ahead log and needs no checkpoint
+    @contextmanager
+    def snapshot(self):
+        fd, tempPath = tempfile.mkstemp(prefix=f"{self.filename}.", suffix=".snapshot")
+        os.close(fd)
+        try:
+            target = sqlite3.connect(tempPath)
+            try:
+                self.connection().backup(target)
+            finally:
+                target.close()
+            yield tempPath
+        finally:
+            os.remove(tempPath)
+
+    #Restores copy the pages into the live database, so other threads' and
+    #processes' connections (and their WAL files) stay valid
+    def replaceDatabase(self, tempPath):
+        source = sqlite3.connect(tempPath)
+        try:
+            source.backup(self.connection())
+        finally:
+            source.close()
+        os.remove(tempPath)
+        #Archives made before a column was added are brought up to date
+        self.createSchema()
+
+    #Releases every thread's connection; a thread that uses the backend again opens a new one
+    def close(self):
+        with self.connectionsLock:
+            connections, self.connections = self.connections, []
+            self.local = threading.local()
+        for conn in connections:
+            conn.close()
+
+    #One-shot streaming import of the colon-delimited tables
+    def migrate(self, fileManager, force=False):
+        results = []
+        for filename in TABLES:
+            if self.count(filename) and not force:
+                results.append((filename, None))
+                continue
+            conn = self.connection()
+            with conn:
+                conn.execute(f"DELETE FROM {TABLES[filename][0]}")
+                self.insertLines(conn, filename, fileManager.iterLines(filename))
+            results.append((filename, self.count(filename)))
+        return results
+
+
+def main(argv=None):
+    from DataManagement.DataManagement import DataManagement
+
+    parser = argparse.ArgumentParser(description="Migrate Happy Trails text tables into SQLite.")
+    parser.add_argument("dataDirectory", nargs="?", default="Data/")
+    parser.add_argument("--database", default=None, help="database path (default: <dataDirectory>/happytrails.db)")
+    parser.add_argument("--force", action="store_true", help="replace tables that already contain rows")
+    args = parser.parse_args(argv)
+
+    source = DataManagement(args.dataDirectory, journaled=True)
+    backend = SqliteBackend(args.database or os.path.join(args.dataDirectory, "happytrails.db"))
+
+    for filename, count in backend.migrate(source, force=args.force):
+        if count is None:
+            print(f"⚠️ Skipped {filename}: table already has rows (use --force).")
+        else:
+            print(f"✅ Migrated {filename}: {count} rows")
+
+    source.close()
+    backend.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+import os
+import threading
+from collections import OrderedDict
+
+class TableCache:
+    #Rough per-line overhead of a str object on top of its characters
+    LINE_OVERHEAD = 56
+
+    def __init__(self, maxBytes=64 * 1024 * 1024):
+        self.maxBytes = maxBytes
+        self.entries = OrderedDict()
+        self.currentBytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def signature(path):
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def estimateSize(self, lines):
+        return sum(len(line) for line in lines) + self.LINE_OVERHEAD * len(lines)
+
+    def get(self, path, signature):
+        with self.lock:
+            entry = self.entries.get(path)
+            if entry is None or signature is None or entry[0] != signature:
+                self.misses += 1
+                return None
+
+            self.entries.move_to_end(path)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, path, signature, lines):
+        if signature is None:
+            return
+
+        lines = tuple(lines)
+        size = self.estimateSize(lines)
+
+        with self.lock:
+            self.discardLocked(path)
+
+            #Tables bigger than the whole budget are never cached
+            if size > self.maxBytes:
+                return
+
+            while self.entries and self.currentBytes + size > self.maxBytes:
+                _, (_, _, evictedSize) = self.entries.popitem(last=False)
+                self.currentBytes -= evictedSize
+                self.evictions += 1
+
+            self.entries[path] = (signature, lines, size)
+            self.currentBytes += size
+
+    def invalidate(self, path):
+        with self.lock:
+            self.discardLocked(path)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.currentBytes = 0
+
+    def discardLocked(self, path):
+        entry = self.entries.pop(path, None)
+        if entry is not None:
+            self.currentBytes -= entry[2]
+
+    def stats(self):
+        with self.lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self.entries),
+                "bytes": self.currentBytes,
+                "maxBytes": self.maxBytes
+            }
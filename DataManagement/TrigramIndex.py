@@ -0,0 +1,139 @@
+from DataManagement.RecordIndex import RecordIndex
+
+#Ranking tiers for search(), best first
+EXACT, PREFIX, WORD_PREFIX, SUBSTRING, FUZZY = range(5)
+
+def wordGrams(word):
+    #Padded so short words and word starts/ends get grams of their own
+    padded = f"  {word} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+def innerGrams(word):
+    return {word[i:i + 3] for i in range(len(word) - 2)}
+
+def textGrams(text):
+    grams = set()
+    for word in text.lower().split():
+        grams |= wordGrams(word)
+    return grams
+
+def dice(first, second):
+    return 2 * len(first & second) / (len(first) + len(second)) if first or second else 0.0
+
+
+class TrigramIndex(RecordIndex):
+    #A RecordIndex that also keeps trigram postings for one text field, so
+    #substring searches only verify texts sharing every trigram of the query and
+    #misspelt queries can be ranked by how many trigrams they share. Postings
+    #point at distinct lowercased texts, so common names are checked only once.
+    FUZZY_THRESHOLD = 0.45
+
+    def __init__(self, uniqueFields, groupFields=None, minFields=1, textField=1):
+        self.textField = textField
+        super().__init__(uniqueFields, groupFields, minFields)
+
+    def clear(self):
+        super().clear()
+        self.postings = {}
+        self.byText = {}
+
+    def link(self, offset):
+        super().link(offset)
+        parts = self.records[offset]
+        key = parts[self.uniqueFields[self.primary]]
+        text = parts[self.textField].lower()
+        members = self.byText.get(text)
+        if members is None:
+            members = self.byText[text] = {}
+            for gram in textGrams(text):
+                self.postings.setdefault(gram, set()).add(text)
+        members[key] = None
+
+    def unlink(self, offset):
+        parts = self.records[offset]
+        key = parts[self.uniqueFields[self.primary]]
+        text = parts[self.textField].lower()
+        members = self.byText.get(text)
+        if members is not None:
+            members.pop(key, None)
+            if not members:
+                del self.byText[text]
+                for gram in textGrams(text):
+                    postings = self.postings.get(gram)
+                    if postings is not None:
+                        postings.discard(text)
+                        if not postings:
+                            del self.postings[gram]
+        super().unlink(offset)
+
+    def keysFor(self, texts):
+        #Record keys for these texts, in record order
+        offsets = self.unique[self.primary]
+        return sorted((key for text in texts for key in self.byText[text]), key=offsets.get)
+
+    def candidates(self, query):
+        #Texts that might contain `query`; every text when the query is too short to narrow with trigrams
+        grams = set()
+        for word in query.split():
+            grams |= innerGrams(word)
+        if not grams:
+            return set(self.byText)
+
+        postings = sorted((self.postings.get(gram, set()) for gram in grams), key=len)
+        texts = set(postings[0])
+        for members in postings[1:]:
+            texts &= members
+            if not texts:
+                break
+        return texts
+
+    def matchingTexts(self, query):
+        return [text for text in self.candidates(query) if query in text]
+
+    def contains(self, query):
+        #Keys whose text contains `query` (case-insensitive), in record order
+        return self.keysFor(self.matchingTexts(query.lower()))
+
+    def search(self, query, limit=None):
+        #-> [(key, tier, similarity)], best first: exact, prefix, word prefix,
+        #substring, then close misspellings above FUZZY_THRESHOLD
+        query = " ".join(query.lower().split())
+        if not query:
+            return []
+
+        ranked = []
+        for text in self.matchingTexts(query):
+            if text == query:
+                tier = EXACT
+            elif text.startswith(query):
+                tier = PREFIX
+            elif any(word.startswith(query) for word in text.split()):
+                tier = WORD_PREFIX
+            else:
+                tier = SUBSTRING
+            ranked.append((text, tier, 1.0))
+
+        #Fuzzy matches: texts sharing at least half of the query's trigrams are
+        #scored by Dice similarity against their closest word, or the whole text
+        if len(query) >= 3:
+            queryGrams = textGrams(query)
+            found = {text for text, _, _ in ranked}
+            shared = {}
+            for gram in queryGrams:
+                for text in self.postings.get(gram, ()):
+                    shared[text] = shared.get(text, 0) + 1
+            for text, count in shared.items():
+                if text in found or 2 * count < len(queryGrams):
+                    continue
+                similarity = max([dice(queryGrams, textGrams(text))] + [dice(queryGrams, wordGrams(word)) for word in text.split()])
+                if similarity >= self.FUZZY_THRESHOLD:
+                    ranked.append((text, FUZZY, similarity))
+
+        ranked.sort(key=lambda item: (item[1], -item[2], item[0]))
+        results = []
+        for text, tier, similarity in ranked:
+            for key in self.keysFor([text]):
+                results.append((key, tier, similarity))
+                if limit is not None and len(results) >= limit:
+                    return results
+        return results
@@ -0,0 +1,89 @@
+import heapq
+
+class WaitlistIndex:
+    #Replays the append-only waitlist log into one heap per session.
+    #ADD:<session>:<camper>:<seq>:<priority>:<timestamp>
+    #DEL:<session>:<camper>:<reason>:<timestamp>
+    #Heap entries are [priority, seq, camper]; removed ones are blanked and
+    #skipped lazily instead of being searched for.
+    def __init__(self):
+        self.signature = None
+        self.clear()
+
+    def __len__(self):
+        return len(self.waiting)
+
+    def clear(self):
+        self.heaps = {}
+        self.waiting = {}
+        self.nextSeq = 1
+
+    def build(self, lines, signature):
+        self.clear()
+        self.addLines(lines)
+        self.signature = signature
+
+    def parse(self, line):
+        line = line.strip()
+        if not line:
+            return None
+        parts = line.split(":", 5)
+        if parts[0] == "ADD" and len(parts) >= 5:
+            try:
+                return ("ADD", parts[1], parts[2], int(parts[3]), int(parts[4]))
+            except ValueError:
+                return None
+        if parts[0] == "DEL" and len(parts) >= 3:
+            return ("DEL", parts[1], parts[2])
+        return None
+
+    def addLines(self, lines):
+        for line in lines:
+            record = self.parse(line)
+            if record is None:
+                continue
+            if record[0] == "ADD":
+                self.add(*record[1:])
+            else:
+                self.remove(record[1], record[2])
+
+    def add(self, session_id, camper_id, seq, priority=0):
+        self.remove(session_id, camper_id)
+        entry = [priority, seq, camper_id]
+        heapq.heappush(self.heaps.setdefault(session_id, []), entry)
+        self.waiting[(session_id, camper_id)] = entry
+        self.nextSeq = max(self.nextSeq, seq + 1)
+
+    def remove(self, session_id, camper_id):
+        entry = self.waiting.pop((session_id, camper_id), None)
+        if entry is not None:
+            entry[2] = None
+
+    def contains(self, session_id, camper_id):
+        return (session_id, camper_id) in self.waiting
+
+    def peek(self, session_id, count):
+        #The first `count` campers in line; popped entries are pushed back, so this is O(count log n)
+        heap = self.heaps.get(session_id)
+        if not heap:
+            return []
+
+        taken = []
+        while heap and len(taken) < count:
+            entry = heapq.heappop(heap)
+            if entry[2] is not None:
+                taken.append(entry)
+        for entry in taken:
+            heapq.heappush(heap, entry)
+        if not heap:
+            del self.heaps[session_id]
+        return [entry[2] for entry in taken]
+
+    def queue(self, session_id):
+        return [entry[2] for entry in sorted(self.heaps.get(session_id, [])) if entry[2] is not None]
+
+    def position(self, session_id, camper_id):
+        entry = self.waiting.get((session_id, camper_id))
+        if entry is None:
+            return None
+        return 1 + sum(1 for other in self.heaps[session_id] if other[2] is not None and other < entry)
@@ -0,0 +1,210 @@
+import os
+import sys
+import csv
+import json
+import time
+import argparse
+
+def loadPreferences(path):
+    #.ndjson/.jsonl: {"camper_id": ..., "preferences": [session, ...]} per line
+    #anything else: CSV rows of camper_id, first choice, second choice, ... (header optional)
+    preferences = {}
+    if os.path.splitext(path)[1].lower() in (".ndjson", ".jsonl"):
+        with open(path, "r", encoding="utf-8") as file:
+            for number, line in enumerate(file, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    item = json.loads(line)
+                    preferences[str(item["camper_id"]).strip().upper()] = [str(s).strip().upper() for s in item["preferences"]]
+                except (ValueError, KeyError, TypeError):
+                    raise ValueError(f"line {number} is not a camper_id/preferences object")
+        return preferences
+
+    with open(path, "r", encoding="utf-8", newline="") as file:
+        for number, row in enumerate(csv.reader(file), start=1):
+            cells = [cell.strip().upper() for cell in row if cell.strip()]
+            if not cells or (number == 1 and cells[0] == "CAMPER_ID"):
+                continue
+            preferences[cells[0]] = cells[1:]
+    return preferences
+
+
+class AutoAssigner:
+    #One session per camper. A greedy pass hands out first choices, then second
+    #choices, and so on; a repair pass then looks for augmenting paths (move an
+    #assigned camper to another of their choices to make room) so as many
+    #campers as possible end up placed.
+    def __init__(self, manager):
+        self.manager = manager
+
+    def buildOptions(self, preferences):
+        manager = self.manager
+        options = {}
+        rejected = {}
+
+        for camper_id, choices in preferences.items():
+            camper = manager.findCamperByID(camper_id)
+            if not camper:
+                rejected[camper_id] = "❌ Camper not found."
+                continue
+
+            #Sessions the camper already attends block any choice on overlapping dates
+            booked = [manager.sessions[r[0]] for r in manager.camperEnrollments(camper_id) if r[0] in manager.sessions]
+            eligible = []
+            seen = set()
+            for rank, sid in enumerate(choices):
+                session = manager.sessions.get(sid)
+                if session is None or sid in seen:
+                    continue
+                seen.add(sid)
+                if not session.min_age <= camper["age"] <= session.max_age:
+                    continue
+                if any(b.session_id == sid or (b.start_date <= session.end_date and b.end_date >= session.start_date) for b in booked):
+                    continue
+                eligible.append((rank, sid))
+
+            if eligible:
+                options[camper_id] = eligible
+            else:
+                rejected[camper_id] = "❌ None of this camper's choices are available to them."
+
+        return options, rejected
+
+    def solve(self, preferences):
+        started = time.perf_counter()
+        options, rejected = self.buildOptions(preferences)
+        capacity = {sid: max(0, s.spots_available) for sid, s in self.manager.sessions.items()}
+        assigned = {}
+        members = {}
+
+        #Greedy: round r gives each unplaced camper their r-th remaining choice if it has room.
+        #Campers with the fewest options go first so flexible campers do not crowd them out.
+        order = sorted(options, key=lambda c: (len(options[c]), c))
+        rounds = max((len(o) for o in options.values()), default=0)
+        for r in range(rounds):
+            for camper_id in order:
+                if camper_id in assigned or r >= len(options[camper_id]):
+                    continue
+                sid = options[camper_id][r][1]
+                if capacity[sid] > 0:
+                    capacity[sid] -= 1
+                    assigned[camper_id] = sid
+                    members.setdefault(sid, {})[camper_id] = None
+
+        greedyCount = len(assigned)
+
+        #Repair: each phase shares one visited set, so a phase costs at most one pass over all choices
+        while True:
+            visited = set()
+            improved = False
+            for camper_id in order:
+                if camper_id not in assigned and self.augment(camper_id, options, capacity, assigned, members, visited):
+                    improved = True
+            if not improved:
+                break
+
+        rankOf = {c: {sid: rank for rank, sid in options[c]} for c in assigned}
+        histogram = {}
+        for camper_id, sid in assigned.items():
+            rank = rankOf[camper_id][sid] + 1
+            histogram[rank] = histogram.get(rank, 0) + 1
+
+        for camper_id in options:
+            if camper_id not in assigned:
+                rejected[camper_id] = "⚠️ Every eligible choice is already full."
+
+        stats = {
+            "campers": len(preferences),
+            "assigned": len(assigned),
+            "assignedByGreedy": greedyCount,
+            "assignedByRepair": len(assigned) - greedyCount,
+            "unassigned": len(rejected),
+            "choiceHistogram": dict(sorted(histogram.items())),
+            "seconds": time.perf_counter() - started
+        }
+        return assigned, rejected, stats
+
+    def augment(self, start, options, capacity, assigned, members, visited):
+        #Iterative DFS alternating camper -> chosen session -> camper already in that session.
+        #frames[0], frames[2], ... are campers; frames[1], frames[3], ... the full sessions they try.
+        frames = [("camper", start, iter(options[start]))]
+        while frames:
+            kind, node, candidates = frames[-1]
+            following = next(candidates, None)
+            if following is None:
+                frames.pop()
+                continue
+
+            if kind == "camper":
+                sid = following[1]
+                if sid in visited:
+                    continue
+                visited.add(sid)
+                if capacity[sid] > 0:
+                    self.shift(frames, sid, capacity, assigned, members)
+                    return True
+                frames.append(("session", sid, iter(list(members.get(sid, {})))))
+            else:
+                frames.append(("camper", following, iter(options[following])))
+        return False
+
+    def shift(self, frames, target, capacity, assigned, members):
+        #Each camper on the path moves into the session after it; the last one takes the open spot
+        campers = [node for kind, node, _ in frames if kind == "camper"]
+        sessions = [node for kind, node, _ in frames if kind == "session"] + [target]
+        for camper_id, sid in zip(campers, sessions):
+            previous = assigned.get(camper_id)
+            if previous is not None:
+                del members[previous][camper_id]
+            assigned[camper_id] = sid
+            members.setdefault(sid, {})[camper_id] = None
+        capacity[target] -= 1
+
+
+def printSummary(stats, rejected):
+    print(f"\n📊 Assigned {stats['assigned']} of {stats['campers']} camper(s) in {stats['seconds']:.2f}s "
+          f"({stats['assignedByRepair']} placed by rearranging others).")
+    for rank, count in stats["choiceHistogram"].items():
+        print(f"   choice #{rank}: {count}")
+    for camper_id, reason in sorted(rejected.items())[:20]:
+        print(f"   {camper_id}: {reason}")
+    if len(rejected) > 20:
+        print(f"   ...and {len(rejected) - 20} more unassigned.")
+
+
+def main(argv=None):
+    from DataManagement.DataManagement import DataManagement
+    from SessionManagement.Sessions import SessionManager
+    from SessionManagement.BulkEnroll import printReport, writeReport
+
+    parser = argparse.ArgumentParser(description="Assign campers to sessions from ranked preferences.")
+    parser.add_argument("preferences", help="CSV (camper_id, choice 1, choice 2, ...) or NDJSON preferences file")
+    parser.add_argument("--data", default="Data/", help="data directory (default: Data/)")
+    parser.add_argument("--dry-run", action="store_true", help="solve and report without enrolling anyone")
+    parser.add_argument("--report", default=None, help="also write the per-row enrollment results as CSV")
+    args = parser.parse_args(argv)
+
+    try:
+        preferences = loadPreferences(args.preferences)
+    except (OSError, ValueError) as e:
+        print(f"❌ Could not read {args.preferences}: {e}")
+        return 1
+
+    fileManager = DataManagement(args.data, journaled=True, backend=os.environ.get("HAPPY_TRAILS_BACKEND", "text"))
+    try:
+        manager = SessionManager(fileManager)
+        results, rejected, stats = manager.autoAssign(preferences, commit=not args.dry_run)
+        if results:
+            printReport(results)
+            if args.report:
+                writeReport(results, args.report)
+                print(f"📄 Report written to {args.report}")
+        printSummary(stats, rejected)
+    finally:
+        fileManager.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
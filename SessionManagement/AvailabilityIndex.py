@@ -0,0 +1,48 @@
+from bisect import bisect_left, insort
+
+class AvailabilityIndex:
+    #age -> [(start_date, session_id)] for sessions that still have open spots,
+    #kept sorted so "open sessions for a 9-year-old" is a single slice.
+    def __init__(self):
+        self.byAge = {}
+        self.entries = {}
+
+    def clear(self):
+        self.byAge.clear()
+        self.entries.clear()
+
+    def update(self, session):
+        #Called whenever a session is added or its dates, ages or spots change
+        self.discard(session.session_id)
+        if session.spots_available <= 0:
+            return
+
+        key = (session.start_date, session.session_id)
+        ages = range(session.min_age, session.max_age + 1)
+        for age in ages:
+            insort(self.byAge.setdefault(age, []), key)
+        self.entries[session.session_id] = (key, ages)
+
+    def discard(self, session_id):
+        entry = self.entries.pop(session_id, None)
+        if entry is None:
+            return
+
+        key, ages = entry
+        for age in ages:
+            bucket = self.byAge[age]
+            del bucket[bisect_left(bucket, key)]
+            if not bucket:
+                del self.byAge[age]
+
+    def available(self, age, fromDate=None, limit=None):
+        bucket = self.byAge.get(age, [])
+        position = bisect_left(bucket, (fromDate,)) if fromDate is not None else 0
+        end = len(bucket) if limit is None else min(len(bucket), position + limit)
+        return [session_id for _, session_id in bucket[position:end]]
+
+    def __contains__(self, session_id):
+        return session_id in self.entries
+
+    def __len__(self):
+        return len(self.entries)
@@ -0,0 +1,92 @@
+import os
+import sys
+import csv
+import json
+import argparse
+
+FIELDS = ("camper_id", "session_id")
+
+def loadPairs(path):
+    #.ndjson/.jsonl: one {"camper_id": ..., "session_id": ...} object per line
+    #anything else: CSV, with or without a camper_id,session_id header
+    if os.path.splitext(path)[1].lower() in (".ndjson", ".jsonl"):
+        return list(readNdjson(path))
+    return list(readCsv(path))
+
+def readNdjson(path):
+    with open(path, "r", encoding="utf-8") as file:
+        for number, line in enumerate(file, start=1):
+            if not line.strip():
+                continue
+            try:
+                item = json.loads(line)
+                yield str(item["camper_id"]), str(item["session_id"])
+            except (ValueError, KeyError, TypeError):
+                raise ValueError(f"line {number} is not a camper_id/session_id object")
+
+def readCsv(path):
+    with open(path, "r", encoding="utf-8", newline="") as file:
+        rows = csv.reader(file)
+        first = next(rows, None)
+        if first is None:
+            return
+
+        header = [cell.strip().lower() for cell in first]
+        if all(field in header for field in FIELDS):
+            camperColumn, sessionColumn = header.index("camper_id"), header.index("session_id")
+        else:
+            camperColumn, sessionColumn = 0, 1
+            rows = [first, *rows]
+
+        for number, row in enumerate(rows, start=1):
+            if not any(cell.strip() for cell in row):
+                continue
+            if len(row) <= max(camperColumn, sessionColumn):
+                raise ValueError(f"row {number} needs a camper ID and a session ID")
+            yield row[camperColumn], row[sessionColumn]
+
+def printReport(results):
+    for result in results:
+        print(f"{result['row']:>5} | {result['camper_id']} → {result['session_id']} | {result['message']}")
+
+    enrolled = sum(1 for result in results if result["status"] == "enrolled")
+    print(f"\n📋 {enrolled} of {len(results)} enrollment(s) completed.")
+
+def writeReport(results, path):
+    with open(path, "w", encoding="utf-8", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=["row", "camper_id", "session_id", "status", "message"])
+        writer.writeheader()
+        writer.writerows(results)
+
+
+def main(argv=None):
+    from DataManagement.DataManagement import DataManagement
+    from SessionManagement.Sessions import SessionManager
+
+    parser = argparse.ArgumentParser(description="Enroll many campers at once from a CSV or NDJSON file.")
+    parser.add_argument("pairs", help="CSV or NDJSON file of camper_id, session_id pairs")
+    parser.add_argument("--data", default="Data/", help="data directory (default: Data/)")
+    parser.add_argument("--report", default=None, help="also write the per-row results as CSV")
+    args = parser.parse_args(argv)
+
+    try:
+        pairs = loadPairs(args.pairs)
+    except (OSError, ValueError) as e:
+        print(f"❌ Could not read {args.pairs}: {e}")
+        return 1
+
+    fileManager = DataManagement(args.data, journaled=True, backend=os.environ.get("HAPPY_TRAILS_BACKEND", "text"))
+    try:
+        results = SessionManager(fileManager).enrollCampersBulk(pairs)
+        printReport(results)
+        if args.report:
+            writeReport(results, args.report)
+            print(f"📄 Report written to {args.report}")
+    finally:
+        fileManager.close()
+
+    return 0 if all(result["status"] == "enrolled" for result in results) else 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
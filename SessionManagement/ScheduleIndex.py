@@ -0,0 +1,80 @@
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+
+class ScheduleIndex:
+    #Per instructor (case-insensitive): intervals sorted by start date, plus a
+    #running maximum of end dates so overlap checks never scan past a gap.
+    def __init__(self):
+        self.schedules = {}
+        self.names = {}
+
+    @staticmethod
+    def key(instructor):
+        return instructor.strip().lower()
+
+    def clear(self):
+        self.schedules.clear()
+        self.names.clear()
+
+    def add(self, session_id, instructor, start, end):
+        key = self.key(instructor)
+        schedule = self.schedules.setdefault(key, {"starts": [], "entries": [], "maxEnds": []})
+        self.names.setdefault(key, instructor.strip())
+
+        #Sessions starting on the same day stay in id order
+        position = bisect_right(schedule["entries"], (start, session_id, end))
+        schedule["starts"].insert(position, start)
+        schedule["entries"].insert(position, (start, session_id, end))
+        self.rebuildFrom(schedule, position)
+
+    def remove(self, session_id, instructor, start, end):
+        key = self.key(instructor)
+        schedule = self.schedules.get(key)
+        if schedule is None:
+            return False
+
+        position = bisect_left(schedule["entries"], (start, session_id, end))
+        if position >= len(schedule["entries"]) or schedule["entries"][position] != (start, session_id, end):
+            return False
+
+        del schedule["starts"][position]
+        del schedule["entries"][position]
+        del schedule["maxEnds"][position]
+        if not schedule["entries"]:
+            del self.schedules[key]
+            del self.names[key]
+            return True
+
+        self.rebuildFrom(schedule, position)
+        return True
+
+    def rebuildFrom(self, schedule, position):
+        #Appends in date order (the usual case) only touch the tail
+        ends = [end for _, _, end in schedule["entries"][position:]]
+        if ends and position > 0:
+            ends[0] = max(ends[0], schedule["maxEnds"][position - 1])
+        schedule["maxEnds"][position:] = list(accumulate(ends, max))
+
+    def iterConflicts(self, instructor, start, end, exclude=None):
+        schedule = self.schedules.get(self.key(instructor))
+        if schedule is None:
+            return
+
+        #Only sessions starting on or before `end` can overlap; walk back until
+        #the running maximum shows nothing earlier reaches `start`.
+        position = bisect_right(schedule["starts"], end) - 1
+        while position >= 0 and schedule["maxEnds"][position] >= start:
+            _, sid, s_end = schedule["entries"][position]
+            if s_end >= start and sid != exclude:
+                yield sid
+            position -= 1
+
+    def firstConflict(self, instructor, start, end, exclude=None):
+        return next(self.iterConflicts(instructor, start, end, exclude), None)
+
+    def freeInstructors(self, start, end):
+        return sorted((self.names[key] for key in self.schedules
+                       if self.firstConflict(key, start, end) is None), key=str.lower)
+
+    def __len__(self):
+        return sum(len(schedule["entries"]) for schedule in self.schedules.values())
@@ -1,54 +1,72 @@
+import sys
 from datetime import datetime, date
 from DataManagement.DataManagement import DataManagement
 from UserManagement.User import User
+from SessionManagement.ScheduleIndex import ScheduleIndex
+from SessionManagement.AvailabilityIndex import AvailabilityIndex
+
+def parseDate(value):
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        return datetime.strptime(value, "%Y-%m-%d").date()
 
 class Session:
-    def __init__(self, session_id, name, activity_type, start_date, end_date, age_group_label, min_age, max_age, capacity, spots_available, instructor):
+    #Loaded catalogues hold many of these, so they are slotted, keep dates as
+    #date objects and share one copy of the strings that repeat across sessions.
+    __slots__ = ("session_id", "name", "activity_type", "start_date", "end_date", "age_group_label",
+                 "min_age", "max_age", "capacity", "spots_available", "instructor", "version")
+
+    def __init__(self, session_id, name, activity_type, start_date, end_date, age_group_label, min_age, max_age, capacity, spots_available, instructor, version=0):
         self.session_id = session_id
         self.name = name
-        self.activity_type = activity_type
-        self.start_date = start_date
-        self.end_date = end_date
-        self.age_group_label = age_group_label
-        self.min_age = min_age
-        self.max_age = max_age
-        self.capacity = capacity
-        self.spots_available = spots_available
-        self.instructor = instructor
+        self.activity_type = sys.intern(activity_type)
+        self.start_date = start_date if isinstance(start_date, date) else parseDate(start_date)
+        self.end_date = end_date if isinstance(end_date, date) else parseDate(end_date)
+        self.age_group_label = sys.intern(age_group_label)
+        self.min_age = int(min_age)
+        self.max_age = int(max_age)
+        self.capacity = int(capacity)
+        self.spots_available = int(spots_available)
+        self.instructor = sys.intern(instructor)
+        #Bumped by every committed change, so writers can tell if their copy is stale
+        self.version = int(version or 0)
 
     def toRecord(self):
-        return f"{self.session_id}:{self.name}:{self.activity_type}:{self.start_date}:{self.end_date}:" \
+        return f"{self.session_id}:{self.name}:{self.activity_type}:{self.start_date.isoformat()}:{self.end_date.isoformat()}:" \
                f"{self.age_group_label}:{self.min_age}:{self.max_age}:{self.capacity}:" \
-               f"{self.spots_available}:{self.instructor}\n"
+               f"{self.spots_available}:{self.instructor}:{self.version}\n"
 
     @staticmethod
     def fromRecord(line):
         parts = line.strip().split(":")
-        if len(parts) != 11:
+        #Records written before versioning have 11 fields
+        if len(parts) not in (11, 12):
+            return None
+        try:
+            return Session(*parts)
+        except ValueError:
+            print(f"⚠️ Skipping malformed session record {parts[0]}.")
             return None
-        return Session(
-            session_id=parts[0],
-            name=parts[1],
-            activity_type=parts[2],
-            start_date=parts[3],
-            end_date=parts[4],
-            age_group_label=parts[5],
-            min_age=int(parts[6]),
-            max_age=int(parts[7]),
-            capacity=int(parts[8]),
-            spots_available=int(parts[9]),
-            instructor=parts[10]
-        )
 
 
 class SessionManager:
+    SESSION_FULL = "❌ Session is already full."
+    SPOTS_FIELD = 9
+    VERSION_FIELD = 11
+
     def __init__(self, fileManager: DataManagement):
         self.fileManager = fileManager
         self.sessions = {}
+        self.schedule = ScheduleIndex()
+        self.availability = AvailabilityIndex()
         self.loadSessions()
     
     #Load & Save Sessions
     def loadSessions(self):
+        self.sessions = {}
+        self.schedule.clear()
+        self.availability.clear()
         lines = self.fileManager.read("sessions.txt")
         if not lines:
             return
@@ -56,15 +74,90 @@ class SessionManager:
             s = Session.fromRecord(line)
             if s:
                 self.sessions[s.session_id] = s
+                self.indexSession(s)
+        self.loadEnrollments()
+
+    def loadEnrollments(self):
+        #Builds the enrollment index now; later checks only reload it if the file changed elsewhere
+        if not self.fileManager.usesBackend("session_enrollments.txt"):
+            self.fileManager.getIndex("session_enrollments.txt")
+
+    #Every change to self.sessions goes through these so the indexes stay in step
+    def indexSession(self, session):
+        self.schedule.add(session.session_id, session.instructor, session.start_date, session.end_date)
+        self.availability.update(session)
+
+    def unindexSession(self, session):
+        self.schedule.remove(session.session_id, session.instructor, session.start_date, session.end_date)
+        self.availability.discard(session.session_id)
+
+    #Spot counts only affect availability, not the schedule
+    def spotsChanged(self, session):
+        self.availability.update(session)
 
     def saveSessions(self):
         text = "".join(s.toRecord() for s in self.sessions.values())
         self.fileManager.write("sessions.txt", text, append=False)
+
+    def saveSession(self, session):
+        self.fileManager.upsert("sessions.txt", session.toRecord())
+
+    #Spot changes are saved as counter deltas, not whole session records;
+    #each one bumps the session's version alongside the spot count
+    def saveSpots(self, changes):
+        adjustments = []
+        for sid, delta in changes.items():
+            if delta:
+                adjustments += [(sid, self.SPOTS_FIELD, delta), (sid, self.VERSION_FIELD, 1)]
+                self.sessions[sid].version += 1
+        return self.fileManager.adjustFields("sessions.txt", adjustments)
+
+    def removeSession(self, session_id):
+        self.fileManager.delete("sessions.txt", session_id)
+
+    #Optimistic concurrency: other processes may change a session after we loaded
+    #it, so writes compare versions under the sessions.txt lock before committing.
+    #Lock order is sessions.txt, then waitlist.txt, then session_enrollments.txt.
+    def storedVersion(self, session_id):
+        parts = self.fileManager.findRecord("sessions.txt", "id", session_id)
+        if not parts:
+            return None
+        return int(parts[self.VERSION_FIELD] or 0) if len(parts) > self.VERSION_FIELD else 0
+
+    def syncSession(self, session_id):
+        #Reloads our copy if the stored version has moved on; returns True if it had
+        session = self.sessions.get(session_id)
+        if self.storedVersion(session_id) == (session.version if session else None):
+            return False
+
+        if session is not None:
+            self.unindexSession(self.sessions.pop(session_id))
+        parts = self.fileManager.findRecord("sessions.txt", "id", session_id)
+        fresh = Session.fromRecord(":".join(parts)) if parts else None
+        if fresh is not None:
+            self.sessions[session_id] = fresh
+            self.indexSession(fresh)
+        return True
+
+    def commitSession(self, session_id, check, commit):
+        #check(session) returns a rejection message or None; commit(session) does the
+        #writes. The first check runs unlocked so hopeless requests never wait; if the
+        #version moved on by the time we hold the lock, reload and check again.
+        error = check(self.sessions.get(session_id))
+        if error:
+            return error
+
+        with self.fileManager.exclusive("sessions.txt"):
+            if self.syncSession(session_id):
+                error = check(self.sessions.get(session_id))
+                if error:
+                    return error
+            return commit(self.sessions[session_id])
     
     #Creating Sessions
 
     def generateID(self):
-        return f"S{1000000 + len(self.sessions)}"
+        return self.fileManager.sequences.next("S")
     
     def createSession(self, adminUser: User):
         if adminUser.getRole().lower() != "admin":
@@ -111,7 +204,8 @@ class SessionManager:
             instructor=instructor
         )
         self.sessions[session_id] = session
-        self.saveSessions()
+        self.indexSession(session)
+        self.saveSession(session)
 
         print(f"✅ Session '{name}' created with ID {session_id}.")
     
@@ -133,8 +227,8 @@ class SessionManager:
 
         name = input(f"Name ({s.name}): ").strip() or s.name
         activity = input(f"Activity Type ({s.activity_type}): ").strip() or s.activity_type
-        start = input(f"Start Date ({s.start_date}): ").strip() or s.start_date
-        end = input(f"End Date ({s.end_date}): ").strip() or s.end_date
+        start = input(f"Start Date ({s.start_date}): ").strip() or s.start_date.isoformat()
+        end = input(f"End Date ({s.end_date}): ").strip() or s.end_date.isoformat()
         age_label = input(f"Age Group ({s.age_group_label}): ").strip() or s.age_group_label
         instructor = input(f"Instructor ({s.instructor}): ").strip() or s.instructor
         capacityStr = input(f"Capacity ({s.capacity}): ").strip() or str(s.capacity)
@@ -150,27 +244,42 @@ class SessionManager:
             return
 
         capacity = int(capacityStr)
-        taken = s.capacity - s.spots_available
-        newSpots = max(0, capacity - taken)
 
-        if not self.validateSessionDetails(name, activity, start, end, min_age, max_age, instructor, capacity):
+        if not self.validateSessionDetails(name, activity, start, end, min_age, max_age, instructor, capacity, exclude_id=sid):
             return
 
-        s.name = name
-        s.activity_type = activity
-        s.start_date = start
-        s.end_date = end
-        s.age_group_label = age_label
-        s.min_age = min_age
-        s.max_age = max_age
-        s.capacity = capacity
-        s.spots_available = newSpots
-        s.instructor = instructor
-
-        self.saveSessions()
+        #The edit only lands on the version it was made against
+        with self.fileManager.exclusive("sessions.txt"):
+            stale = self.syncSession(sid)
+            if not stale:
+                taken = s.capacity - s.spots_available
+                self.unindexSession(s)
+                s.name = name
+                s.activity_type = sys.intern(activity)
+                s.start_date = parseDate(start)
+                s.end_date = parseDate(end)
+                s.age_group_label = sys.intern(age_label)
+                s.min_age = min_age
+                s.max_age = max_age
+                s.capacity = capacity
+                s.spots_available = max(0, capacity - taken)
+                s.instructor = sys.intern(instructor)
+                s.version += 1
+                self.indexSession(s)
+
+                self.saveSession(s)
+
+        if stale:
+            print("⚠️ This session was changed elsewhere while you were editing. It has been reloaded; please try again.")
+            return
 
         print("✅ Session updated successfully.")
 
+        #Extra capacity goes to the waitlist first
+        if s.spots_available > 0:
+            for camper in self.promoteWaitlist(sid):
+                print(f"🎟️ {camper['name']} ({camper['id']}) moved from the waitlist into {s.name}.")
+
     def deleteSession(self, adminUser: User):
         if adminUser.getRole().lower() != "admin":
             print("❌ Unauthorized.")
@@ -182,42 +291,57 @@ class SessionManager:
             print("❌ No such session.")
             return
 
-        del self.sessions[sid]
-        self.saveSessions()
+        self.unindexSession(self.sessions.pop(sid))
+        self.removeSession(sid)
+        self.clearWaitlist(sid, "session deleted")
 
         print("🗑️ Session deleted successfully.")
     
-    def displaySessions(self):
-        if not self.sessions:
-            print("⚠️ No sessions available.")
+    def availableSessions(self, age: int, fromDate=None, limit=None):
+        #Sessions with open spots that take this age, earliest start first
+        return [self.sessions[sid] for sid in self.availability.available(age, fromDate, limit)]
+
+    def displaySessions(self, age=None):
+        sessions = list(self.sessions.values()) if age is None else self.availableSessions(age)
+        if not sessions:
+            print("⚠️ No sessions available." if age is None else f"⚠️ No open sessions for age {age}.")
             return
 
-        print("\n=== Available Sessions ===")
-        for s in self.sessions.values():
+        print("\n=== Available Sessions ===" if age is None else f"\n=== Open Sessions for Age {age} ===")
+        for s in sessions:
             print(f"{s.session_id} | {s.name} | {s.activity_type} | {s.start_date}→{s.end_date} | "
                   f"Ages {s.min_age}-{s.max_age} | {s.spots_available}/{s.capacity} spots | Instructor: {s.instructor}")
+
+    def displaySessionsForAgeInteractive(self):
+        ageStr = input("Camper age: ").strip()
+        if not ageStr.isdigit():
+            print("Age must be numeric.")
+            return
+        self.displaySessions(int(ageStr))
             
     def addCamperToSession(self, session_id: str, camper_age: int):
         sid = session_id.strip().upper()
 
-        if sid not in self.sessions:
-            print("Session not found.")
-            return False
-
-        s = self.sessions[sid]
+        def check(s):
+            if s is None:
+                return "Session not found."
+            if s.spots_available <= 0:
+                return "Session is full."
+            if camper_age < s.min_age or camper_age > s.max_age:
+                return f"Camper age {camper_age} does not fit session age range {s.min_age}-{s.max_age}."
+            return None
 
-        if s.spots_available <= 0:
-            print("Session is full.")
-            return False
+        def commit(s):
+            s.spots_available -= 1
+            self.spotsChanged(s)
+            self.saveSpots({sid: -1})
 
-        if camper_age < s.min_age or camper_age > s.max_age:
-            print(f"Camper age {camper_age} does not fit session age range {s.min_age}-{s.max_age}.")
+        error = self.commitSession(sid, check, commit)
+        if error:
+            print(error)
             return False
 
-        s.spots_available -= 1
-        self.saveSessions()
-
-        print(f"Camper added to session {sid}. Spots remaining: {s.spots_available}.")
+        print(f"Camper added to session {sid}. Spots remaining: {self.sessions[sid].spots_available}.")
         return True
 
     def addCamperToSessionInteractive(self):
@@ -232,7 +356,7 @@ class SessionManager:
         camper_age = int(ageStr)
         self.addCamperToSession(sid, camper_age)
 
-    def validateSessionDetails(self, name: str, activity: str, start: str, end: str, min_age: int, max_age: int, instructor: str, capacity: int):
+    def validateSessionDetails(self, name: str, activity: str, start: str, end: str, min_age: int, max_age: int, instructor: str, capacity: int, exclude_id=None):
         if not name or not activity or not instructor:
             print("❌ Missing required fields.")
             return False
@@ -256,92 +380,380 @@ class SessionManager:
             print("❌ Capacity must be greater than zero.")
             return False
 
-        # Overlap check (REQ 3.8)
-        for sid, sess in self.sessions.items():
-            if sess.instructor.lower() != instructor.lower():
-                continue  # different instructor ok
+        # Overlap check (REQ 3.8) — the session being edited never conflicts with itself
+        if self.schedule.firstConflict(instructor, startD, endD, exclude=exclude_id):
+            print(f"❌ Overlapping schedule for instructor {instructor}. (REQ-3.8)")
+            return False
+
+        return True
 
-            s1_start = datetime.strptime(sess.start_date, "%Y-%m-%d").date()
-            s1_end = datetime.strptime(sess.end_date, "%Y-%m-%d").date()
+    def freeInstructors(self, start, end):
+        return self.schedule.freeInstructors(parseDate(start), parseDate(end))
 
-            if not (endD < s1_start or startD > s1_end):
-                print(f"❌ Overlapping schedule for instructor {instructor}. (REQ-3.8)")
-                return False
+    def freeInstructorsInteractive(self):
+        print("\n=== Free Instructors ===")
+        start = input("From (YYYY-MM-DD): ").strip()
+        end = input("To (YYYY-MM-DD): ").strip()
 
-        return True
+        try:
+            free = self.freeInstructors(start, end)
+        except ValueError:
+            print("❌ Invalid date format. Use YYYY-MM-DD.")
+            return
+
+        if not free:
+            print(f"⚠️ No instructors are free between {start} and {end}.")
+            return
+
+        for instructor in free:
+            print(f"- {instructor}")
 
     def findCamperByID(self, camper_id: str):
-        lines = self.fileManager.read("camper.txt")
-        if not lines:
+        record = self.fileManager.findCamper(camper_id.upper())
+        if not record:
             return None
 
-        for line in lines:
-            parts = line.strip().split(":")
-            if len(parts) < 3:
-                continue
-            if parts[0].upper() == camper_id.upper():
-                return {
-                    "id": parts[0],
-                    "name": parts[1],
-                    "age": int(parts[2])
-                }
-
-        return None
+        return {
+            "id": record[0],
+            "name": record[1],
+            "age": record[2],
+            "parent": record[4]
+        }
     
     def enrollCamper(self, camper_id: str, session_id: str, user: User):
+        #One fetch covers ownership, existence and age
+        camper = self.findCamperByID(camper_id)
+
         #Validate permissions — parents can only enroll their children
-        if user.getRole().lower() == "parent":
-            camper = self.findCamperByID(camper_id)
-            if not camper or camper["id"] not in str(self.fileManager.read("camper.txt")):
-                print("❌ You can only enroll your own children.")
-                return False
+        if user.getRole().lower() == "parent" and (not camper or camper["parent"] != user.getID()):
+            print("❌ You can only enroll your own children.")
+            return False
 
+        sid = session_id.upper()
+
+        def commit(session):
+            #6. Write enrollment record
+            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
+            record = f"{sid}:{camper['id']}:{camper['name']}:{timestamp}\n"
+            if not self.fileManager.write("session_enrollments.txt", record, append=True):
+                return "❌ Enrollment could not be saved."
+
+            #7. Update spots & record the decrement
+            session.spots_available -= 1
+            self.spotsChanged(session)
+            self.saveSpots({sid: -1})
+            return None
+
+        error = self.commitSession(sid, lambda session: self.checkEnrollment(camper, sid), commit)
+        if error == self.SESSION_FULL:
+            self.waitlistCamper(camper, sid)
+            return False
+        if error:
+            print(error)
+            return False
+
+        print(f"✅ {camper['name']} successfully enrolled in {self.sessions[sid].name} ({sid}).")
+        return True
+
+    #Steps 1-5 of an enrollment; returns the rejection message, or None if it can go ahead.
+    #`pending` holds (session, camper) pairs accepted earlier in the same batch.
+    def checkEnrollment(self, camper, session_id: str, pending=None):
         #1. Check camper exists
-        camper = self.findCamperByID(camper_id)
         if not camper:
-            print("❌ Camper not found.")
-            return False
+            return "❌ Camper not found."
 
         #2. Check session exists
         sid = session_id.upper()
         if sid not in self.sessions:
-            print("❌ Session ID does not exist.")
-            return False
+            return "❌ Session ID does not exist."
 
         session = self.sessions[sid]
 
         #3. Age eligibility
         age = camper["age"]
         if age < session.min_age or age > session.max_age:
-            print(f"❌ Camper age {age} does not meet session requirement ({session.min_age}-{session.max_age}).")
-            return False
+            return f"❌ Camper age {age} does not meet session requirement ({session.min_age}-{session.max_age})."
 
-        #4. Capacity check
+        #4. Prevent duplicate enrollment
+        if (pending and (sid, camper["id"]) in pending) or self.fileManager.isEnrolled(sid, camper["id"]):
+            return "⚠️ Camper is already enrolled in this session."
+
+        #5. Capacity check — callers fall back to the waitlist on this one
         if session.spots_available <= 0:
-            print("❌ Session is already full.")
-            return False
+            return self.SESSION_FULL
 
-        #5. Prevent duplicate enrollment
-        enrollments = self.fileManager.read("session_enrollments.txt")
-        if enrollments:
-            for line in enrollments:
-                parts = line.strip().split(":")
-                if len(parts) >= 2 and parts[0] == sid and parts[1] == camper_id:
-                    print("⚠️ Camper is already enrolled in this session.")
-                    return False
+        return None
 
-        #6. Write enrollment record
+    #Bulk enrollment: validate every row first, then one append and one batch of spot deltas.
+    #The batch holds the sessions lock throughout, checking against fresh copies of its sessions.
+    def enrollCampersBulk(self, pairs, user: User = None):
+        pairs = list(pairs)
+        with self.fileManager.exclusive("sessions.txt"):
+            for sid in {session_id.strip().upper() for _, session_id in pairs}:
+                self.syncSession(sid)
+            return self.commitEnrollments(pairs, user)
+
+    def commitEnrollments(self, pairs, user: User = None):
+        results = []
+        records = []
+        waiting = []
+        pending = set()
+        touched = {}
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
-        record = f"{sid}:{camper_id}:{camper['name']}:{timestamp}\n"
-        self.fileManager.write("session_enrollments.txt", record, append=True)
+        parentID = user.getID() if user is not None and user.getRole().lower() == "parent" else None
 
-        #7. Update spots & save sessions
-        session.spots_available -= 1
-        self.saveSessions()
+        for row, (camper_id, session_id) in enumerate(pairs, start=1):
+            camper_id = camper_id.strip().upper()
+            sid = session_id.strip().upper()
+
+            camper = self.findCamperByID(camper_id)
+            if parentID and camper and camper["parent"] != parentID:
+                results.append({"row": row, "camper_id": camper_id, "session_id": sid, "status": "rejected",
+                                "message": "❌ You can only enroll your own children."})
+                continue
+
+            error = self.checkEnrollment(camper, sid, pending)
+            if error == self.SESSION_FULL and (sid, camper_id) not in pending:
+                if not self.getWaitlist().contains(sid, camper_id):
+                    waiting.append((sid, camper_id, 0))
+                    pending.add((sid, camper_id))
+                results.append({"row": row, "camper_id": camper_id, "session_id": sid, "status": "waitlisted",
+                                "message": "⏳ Session is full; camper is on the waitlist."})
+                continue
+            if error:
+                results.append({"row": row, "camper_id": camper_id, "session_id": sid, "status": "rejected", "message": error})
+                continue
+
+            session = self.sessions[sid]
+            touched.setdefault(sid, session.spots_available)
+            session.spots_available -= 1
+            pending.add((sid, camper_id))
+            records.append(f"{sid}:{camper_id}:{camper['name']}:{timestamp}\n")
+            results.append({"row": row, "camper_id": camper_id, "session_id": sid, "status": "enrolled",
+                            "message": f"✅ {camper['name']} enrolled in {session.name} ({sid})."})
+
+        if waiting and not self.addToWaitlist(waiting):
+            for result in results:
+                if result["status"] == "waitlisted":
+                    result["status"] = "failed"
+                    result["message"] = "❌ Waitlist records could not be written."
+
+        if not records:
+            return results
+
+        if not self.fileManager.write("session_enrollments.txt", records, append=True):
+            #Nothing was written, so put the spots back and report every accepted row as failed
+            for sid, spots in touched.items():
+                self.sessions[sid].spots_available = spots
+            for result in results:
+                if result["status"] == "enrolled":
+                    result["status"] = "failed"
+                    result["message"] = "❌ Enrollment records could not be written."
+            return results
+
+        for sid in touched:
+            self.spotsChanged(self.sessions[sid])
+        self.saveSpots({sid: self.sessions[sid].spots_available - spots for sid, spots in touched.items()})
+        return results
+
+    def bulkEnrollInteractive(self, user: User):
+        from SessionManagement.BulkEnroll import loadPairs, printReport
+
+        print("\n=== Bulk Enroll from File ===")
+        path = input("Path to CSV or NDJSON file: ").strip()
+
+        try:
+            pairs = loadPairs(path)
+        except (OSError, ValueError) as e:
+            print(f"❌ Could not read {path}: {e}")
+            return
+
+        printReport(self.enrollCampersBulk(pairs, user))
+
+    #Auto-assignment from ranked preferences, committed through the bulk path
+    def autoAssign(self, preferences, commit=True, user: User = None):
+        from SessionManagement.AutoAssign import AutoAssigner
+
+        assigned, rejected, stats = AutoAssigner(self).solve(preferences)
+        results = self.commitAssignment(assigned, user) if commit else []
+        return results, rejected, stats
+
+    #Enrolls exactly this assignment. enrollCampersBulk re-checks every session
+    #under the sessions lock, so spots taken since the solve send campers to the waitlist.
+    def commitAssignment(self, assigned, user: User = None):
+        return self.enrollCampersBulk(sorted(assigned.items()), user) if assigned else []
+
+    def autoAssignInteractive(self, user: User):
+        from SessionManagement.AutoAssign import AutoAssigner, loadPreferences, printSummary
+        from SessionManagement.BulkEnroll import printReport
+
+        print("\n=== Auto-Assign Campers ===")
+        path = input("Path to preferences file (CSV or NDJSON): ").strip()
+
+        try:
+            preferences = loadPreferences(path)
+        except (OSError, ValueError) as e:
+            print(f"❌ Could not read {path}: {e}")
+            return
+
+        assigned, rejected, stats = AutoAssigner(self).solve(preferences)
+        printSummary(stats, rejected)
+        if not assigned:
+            return
+
+        confirm = input(f"Enroll these {len(assigned)} camper(s) now? (y/n): ").strip().lower()
+        if confirm == "y":
+            #The previewed assignment is what gets committed; it is not solved again
+            results = self.commitAssignment(assigned, user)
+            printReport(results)
+            changed = sum(1 for result in results if result["status"] != "enrolled")
+            if changed:
+                print(f"⚠️ {changed} previewed assignment(s) could not be enrolled as shown; see the report above.")
+
+    #Waitlist: full sessions queue campers in waitlist.txt, an append-only log of
+    #ADD/DEL records that the DataManagement waitlist index replays into heaps.
+    def getWaitlist(self):
+        return self.fileManager.getIndex("waitlist.txt")
+
+    def addToWaitlist(self, entries):
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
+        #Sequence numbers come from the current file, so the lock spans read and append
+        with self.fileManager.exclusive("waitlist.txt"):
+            seq = self.getWaitlist().nextSeq
+            records = [f"ADD:{sid}:{camper_id}:{seq + i}:{entryPriority}:{timestamp}\n"
+                       for i, (sid, camper_id, entryPriority) in enumerate(entries)]
+            return self.fileManager.write("waitlist.txt", records, append=True)
+
+    def waitlistCamper(self, camper, session_id: str, priority=0):
+        waitlist = self.getWaitlist()
+        if not waitlist.contains(session_id, camper["id"]):
+            if not self.addToWaitlist([(session_id, camper["id"], priority)]):
+                print("❌ Session is full and the waitlist could not be updated.")
+                return False
+            waitlist = self.getWaitlist()
+            print(f"⏳ Session is full. {camper['name']} was added to the waitlist "
+                  f"(position {waitlist.position(session_id, camper['id'])}).")
+            return True
+
+        print(f"⚠️ Session is full. {camper['name']} is already on the waitlist "
+              f"(position {waitlist.position(session_id, camper['id'])}).")
+        return False
+
+    def clearWaitlist(self, session_id: str, reason: str):
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
+        with self.fileManager.exclusive("waitlist.txt"):
+            campers = self.getWaitlist().queue(session_id)
+            if campers:
+                self.fileManager.write("waitlist.txt", [f"DEL:{session_id}:{c}:{reason}:{timestamp}\n" for c in campers], append=True)
+
+    def promoteWaitlist(self, session_id: str):
+        #Fills open spots from the front of the line in one batch: one enrollment
+        #append, one waitlist append and one spot delta.
+        sid = session_id.upper()
+        with self.fileManager.exclusive("sessions.txt"):
+            self.syncSession(sid)
+            return self.promoteFromWaitlist(sid)
+
+    def promoteFromWaitlist(self, sid):
+        session = self.sessions.get(sid)
+        if session is None or session.spots_available <= 0:
+            return []
+
+        promoted = []
+        records = []
+        removals = []
+        pending = set()
+        spotsBefore = session.spots_available
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
+
+        with self.fileManager.exclusive("waitlist.txt"):
+            waitlist = self.getWaitlist()
+            while session.spots_available > 0:
+                front = waitlist.peek(sid, session.spots_available)
+                if not front:
+                    break
+
+                for camper_id in front:
+                    #Taken off the in-memory heap now; the DEL records below make it permanent
+                    waitlist.remove(sid, camper_id)
+                    camper = self.findCamperByID(camper_id)
+                    if self.checkEnrollment(camper, sid, pending):
+                        removals.append(f"DEL:{sid}:{camper_id}:ineligible:{timestamp}\n")
+                        continue
+
+                    session.spots_available -= 1
+                    pending.add((sid, camper_id))
+                    records.append(f"{sid}:{camper_id}:{camper['name']}:{timestamp}\n")
+                    removals.append(f"DEL:{sid}:{camper_id}:promoted:{timestamp}\n")
+                    promoted.append(camper)
+
+            if records and not self.fileManager.write("session_enrollments.txt", records, append=True):
+                session.spots_available = spotsBefore
+                waitlist.signature = None
+                print("❌ Waitlist promotion failed; nobody was moved.")
+                return []
+
+            if removals and not self.fileManager.write("waitlist.txt", removals, append=True):
+                waitlist.signature = None
+
+        if records:
+            self.spotsChanged(session)
+            self.saveSpots({sid: session.spots_available - spotsBefore})
+        return promoted
+
+    def viewWaitlistInteractive(self):
+        sid = input("Enter Session ID: ").strip().upper()
+        if sid not in self.sessions:
+            print("❌ Session ID does not exist.")
+            return
+
+        campers = self.getWaitlist().queue(sid)
+        if not campers:
+            print("⚠️ Nobody is waiting for this session.")
+            return
+
+        print(f"\n=== Waitlist for {self.sessions[sid].name} ({sid}) ===")
+        for position, camper_id in enumerate(campers, start=1):
+            camper = self.findCamperByID(camper_id)
+            print(f"{position}. {camper_id} | {camper['name'] if camper else '(camper no longer exists)'}")
+
+    #Enrollment lookups
+    def roster(self, session_id: str):
+        return self.fileManager.findGroup("session_enrollments.txt", "session", session_id.upper())
+
+    def camperEnrollments(self, camper_id: str):
+        return self.fileManager.findGroup("session_enrollments.txt", "camper", camper_id.upper())
+
+    def viewRosterInteractive(self):
+        sid = input("Enter Session ID: ").strip().upper()
+        if sid not in self.sessions:
+            print("❌ Session ID does not exist.")
+            return
+
+        session = self.sessions[sid]
+        records = self.roster(sid)
+        print(f"\n=== Roster for {session.name} ({sid}) — {len(records)}/{session.capacity} ===")
+        if not records:
+            print("⚠️ No campers enrolled yet.")
+            return
+        for record in records:
+            print(f"{record[1]} | {record[2]}")
+
+    def viewCamperEnrollmentsInteractive(self):
+        camper_id = input("Enter Camper ID: ").strip().upper()
+        records = self.camperEnrollments(camper_id)
+        if not records:
+            print("⚠️ This camper is not enrolled in any sessions.")
+            return
+
+        print(f"\n=== Sessions for {camper_id} ===")
+        for record in records:
+            session = self.sessions.get(record[0])
+            if session:
+                print(f"{session.session_id} | {session.name} | {session.start_date}→{session.end_date}")
+            else:
+                print(f"{record[0]} | (session no longer exists)")
 
-        print(f"✅ {camper['name']} successfully enrolled in {session.name} ({sid}).")
-        return True
-    
     def enrollCamperInteractive(self, user: User):
         print("\n=== Enroll Camper into a Session ===")
         camper_id = input("Enter Camper ID: ").strip().upper()
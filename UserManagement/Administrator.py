@@ -1,5 +1,6 @@
 from UserManagement.User import User
 import DataManagement
+import os
 
 class Administrator(User):
     def __init__(self, id: str, name: str, password: str, role: str, fileManager: DataManagement, authenticated: bool):
@@ -142,7 +143,7 @@ class Administrator(User):
 
         if c == "1":
             instructor = input("Instructor Name: ").strip()
-            data = [l for l in lines if l.endswith(f":{instructor}")]
+            data = [l for l in lines if len(l.split(":")) > 10 and l.split(":")[10].strip() == instructor]
             action = f"Generated Session Report (instructor={instructor})"
 
         elif c == "2":
@@ -158,7 +159,7 @@ class Administrator(User):
         self.logAction(action)
     
     def generateLogReport(self):
-        lines = self.getFileManager().read("log.txt")
+        fileManager = self.getFileManager()
 
         print("\nFilter Logs by:")
         print("1. User ID")
@@ -167,25 +168,27 @@ class Administrator(User):
 
         c = input("Choose: ")
 
+        #Filters are applied to the raw lines while streaming log.txt, never loading it whole
+        lines = fileManager.iterLines("log.txt")
         if c == "1":
             uid = input("User ID: ").strip()
-            data = [l for l in lines if l.startswith(uid + ":")]
+            data = (line for line in lines if line.startswith(f"{uid}:"))
             action = f"Generated Log Report (userID={uid})"
 
         elif c == "2":
             action = input("Action (keyword): ").strip()
-            data = [l for l in lines if action.lower() in l.lower()]
+            keyword = action.lower()
+            data = (line for line in lines if keyword in line.lower())
 
         else:
             data = lines
             action = "Generated Log Report (all logs)"
 
-        self.getFileManager().createReport("log.txt", data)
+        fileManager.createReport("log.txt", data)
         self.logAction(action)
 
     def deleteUserByID(self):
         fileManager = self.getFileManager()
-        lines = fileManager.read("users.txt")
 
         print("\nDelete User Account")
         uid = input("Enter User ID to delete: ").strip()
@@ -194,39 +197,28 @@ class Administrator(User):
             print("You cannot delete your own admin account.")
             return
 
-        updated = []
-        deleted_user = None
-
         #Find the user by ID
-        for line in lines:
-            parts = line.split(":")
-            userID = parts[0]
-
-            if userID == uid:
-                deleted_user = line
-            else:
-                updated.append(line)
+        deleted_user = fileManager.findRecord("users.txt", "id", uid)
 
         if not deleted_user:
             print("User ID not found.")
             return
 
-        print(f"\nFound User: {deleted_user.split(":")[2]}")
+        print(f"\nFound User: {deleted_user[2]}")
         confirm = input("Are you SURE you want to delete this user? (y/n): ").lower()
 
         if confirm != "y":
             print("Deletion cancelled.")
             return
 
-        #Write updated list back
-        fileManager.write("users.txt", updated,False)
+        #Remove only that record
+        fileManager.delete("users.txt", uid)
 
         print("User deleted successfully.")
         self.logAction(f"Deleted user with ID {uid}")
 
     def editUser(self):
         fileManager = self.getFileManager()
-        lines = fileManager.read("users.txt")
 
         print("\nEdit User Account")
         uid = input("Enter User ID to edit: ").strip()
@@ -234,16 +226,8 @@ class Administrator(User):
         #Validation: cannot change your own role
         editing_self = (uid == self.getID())
 
-        target_line = None
-        updated = []
-
         #Find target user
-        for line in lines:
-            parts = line.strip().split(":")
-            if parts[0] == uid:
-                target_line = parts
-            else:
-                updated.append(line)
+        target_line = fileManager.findRecord("users.txt", "id", uid)
 
         if not target_line:
             print("❌ User ID not found.")
@@ -273,6 +257,10 @@ class Administrator(User):
             if not newUsername:
                 print("❌ Username cannot be empty.")
                 return
+            existing = fileManager.findUser(newUsername)
+            if existing and existing[0] != uid:
+                print("❌ Username already exists.")
+                return
             username = newUsername
             self.logAction(f"Edited Username (ID={uid})")
 
@@ -319,40 +307,46 @@ class Administrator(User):
                 return
 
             #Generate NEW ID based on new role
-            if newRole == "Staff":
-                prefix = "STF_"
-            elif newRole == "Parent":
-                prefix = "PRT_"
+            newID = self.allocateIds(fileManager, newRole)[0]
 
-            #Auto-increment ID number based on existing IDs
-            existing = self.getFileManager().read("users.txt")
-            next_num = 0
+            print(f"Changing role. Old ID={uid}, New ID={newID}")
 
-            for line in existing:
-                parts = line.split(":")
-                if parts[0].startswith(prefix):
-                    num = int(parts[0].split("_")[1])
-                    if num >= next_num:
-                        next_num = num + 1
+            #Update role + ID in memory
+            userID = newID
+            role = newRole
 
-            newID = f"{prefix}{next_num}"
+            self.logAction(f"Changed role for user → NewRole={role}, NewID={userID}")
 
-            print(f"Changing role. Old ID={uid}, New ID={newID}")
+        #Rebuild updated line
+        newLine = f"{userID}:{role}:{username}:{password}"
+
+        #Save only the changed record; a new ID replaces the old one in the same commit
+        changes = [("U", userID, newLine)]
+        if userID != uid:
+            changes.insert(0, ("D", uid, None))
+        if not fileManager.applyChanges("users.txt", changes):
+            print("❌ User could not be updated.")
+            return
 
-        #Update role + ID in memory
-        userID = newID
-        role = newRole
+        print("User updated successfully.")
 
-        self.logAction(f"Changed role for user → NewRole={role}, NewID={uid}")
+    def bulkImportInteractive(self):
+        from UserManagement.BulkImport import loadRows, importUsers, printReport
 
-        #Rebuild updated line
-        newLine = f"{userID}:{role}:{username}:{password}\n"
-        updated.append(newLine)
+        print("\nBulk Import Accounts")
+        path = input("Path to CSV file (role, username, password): ").strip()
 
-        #Save file
-        fileManager.write("users.txt", updated, False)
+        try:
+            rows = loadRows(path)
+        except (OSError, ValueError) as e:
+            print(f"❌ Could not read {path}: {e}")
+            return
 
-        print("User updated successfully.")
+        results = importUsers(self.getFileManager(), rows, creator=self)
+        printReport(results)
+        created = sum(1 for result in results if result["status"] == "created")
+        if created:
+            self.logAction(f"Bulk imported {created} account(s) from {os.path.basename(path)}")
 
     def showDashboard(self):
         print("\n--- ADMIN DASHBOARD ---")
@@ -363,5 +357,6 @@ class Administrator(User):
         print("5. Backup/Restore Data")
         print("6. Session Management Dashboard")
         print("7. View Camper Info")
-        print("8. Logout")
+        print("8. Bulk Import Accounts from File")
+        print("9. Logout")
     
\ No newline at end of file
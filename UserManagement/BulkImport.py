@@ -0,0 +1,160 @@
+import os
+import sys
+import csv
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+from Authenticator.PasswordHasher import PasswordHasher, CONFIG_FILE
+from UserManagement.User import User
+
+FIELDS = ("role", "username", "password")
+#Below this many passwords, starting worker processes costs more than it saves
+POOL_THRESHOLD = 8
+
+def loadRows(path):
+    #CSV of role, username, password, with or without that header
+    with open(path, "r", encoding="utf-8", newline="") as file:
+        rows = csv.reader(file)
+        first = next(rows, None)
+        if first is None:
+            return []
+
+        header = [cell.strip().lower() for cell in first]
+        if all(field in header for field in FIELDS):
+            columns = [header.index(field) for field in FIELDS]
+        else:
+            columns = [0, 1, 2]
+            rows = [first, *rows]
+
+        loaded = []
+        for number, row in enumerate(rows, start=1):
+            if not any(cell.strip() for cell in row):
+                continue
+            if len(row) <= max(columns):
+                raise ValueError(f"row {number} needs a role, a username and a password")
+            loaded.append(tuple(row[column].strip() for column in columns))
+        return loaded
+
+#Module level so worker processes can unpickle it
+def hashPassword(config, password):
+    return PasswordHasher(config).hash(password)
+
+def hashAll(config, passwords, workers=None):
+    if workers == 1 or len(passwords) < POOL_THRESHOLD:
+        return [hashPassword(config, password) for password in passwords]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        chunk = max(1, len(passwords) // ((workers or os.cpu_count() or 1) * 4))
+        return list(pool.map(hashPassword, [config] * len(passwords), passwords, chunksize=chunk))
+
+def importUsers(fileManager, rows, creator: User = None, workers=None, allowAdmin=False):
+    #Validates every row, hashes the accepted passwords across processes, takes a
+    #block of IDs per role, then appends all the new users in one write
+    results = []
+    accepted = []
+    seen = set()
+
+    for row, (role, username, password) in enumerate(rows, start=1):
+        role = role.capitalize()
+        result = {"row": row, "role": role, "username": username, "id": "", "status": "rejected"}
+        results.append(result)
+
+        #Without a logged-in creator (the command line), Admin accounts need an explicit opt-in
+        permitted = creator.canCreate(role) if creator is not None else role != "Admin" or allowAdmin
+
+        if role not in User.rolePrefix or not permitted:
+            result["message"] = f"❌ Cannot create a user with role '{role}'."
+        elif not username or ":" in username:
+            result["message"] = "❌ Username must be non-empty and cannot contain ':'."
+        elif username in seen or fileManager.findUser(username):
+            result["message"] = "❌ Username already exists."
+        elif not User.isStrongPassword(password):
+            result["message"] = "❌ Password must include uppercase, lowercase, number, and special character (min 8 chars)."
+        else:
+            seen.add(username)
+            accepted.append((result, password))
+
+    if not accepted:
+        return results
+
+    hasher = PasswordHasher.load(fileManager.getFilePath(CONFIG_FILE))
+    hashes = hashAll(hasher.config, [password for _, password in accepted], workers)
+
+    #One block of IDs per role. The sequence lock comes before the table lock, so
+    #blocks are taken first; IDs left over by rows rejected below just leave gaps.
+    byRole = {}
+    for (result, _), hashed in zip(accepted, hashes):
+        byRole.setdefault(result["role"], []).append((result, hashed))
+    blocks = {role: iter(User.allocateIds(fileManager, role, len(members))) for role, members in byRole.items()}
+
+    with fileManager.exclusive("users.txt"):
+        #Another terminal may have registered some of these names while we were hashing
+        pending = []
+        records = []
+        for role, members in byRole.items():
+            for result, hashed in members:
+                if fileManager.findUser(result["username"]):
+                    result["message"] = "❌ Username already exists."
+                    continue
+                result["id"] = next(blocks[role])
+                pending.append((result, hashed))
+                records.append(f"{result['id']}:{role}:{result['username']}:{hashed}\n")
+
+        written = bool(records) and fileManager.write("users.txt", records, append=True)
+
+    for result, _ in pending:
+        if written:
+            result["status"] = "created"
+            result["message"] = f"✅ {result['role']} '{result['username']}' created with ID {result['id']}."
+        else:
+            result["status"] = "failed"
+            result["id"] = ""
+            result["message"] = "❌ User records could not be written."
+    return results
+
+def printReport(results):
+    for result in results:
+        print(f"{result['row']:>5} | {result['role']} {result['username']} | {result['message']}")
+
+    created = sum(1 for result in results if result["status"] == "created")
+    print(f"\n📋 {created} of {len(results)} account(s) created.")
+
+def writeReport(results, path):
+    with open(path, "w", encoding="utf-8", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=["row", "role", "username", "id", "status", "message"])
+        writer.writeheader()
+        writer.writerows(results)
+
+
+def main(argv=None):
+    from DataManagement.DataManagement import DataManagement
+
+    parser = argparse.ArgumentParser(description="Create many user accounts at once from a CSV file.")
+    parser.add_argument("users", help="CSV file of role, username, password rows")
+    parser.add_argument("--data", default="Data/", help="data directory (default: Data/)")
+    parser.add_argument("--workers", type=int, default=None, help="password hashing processes (default: one per CPU)")
+    parser.add_argument("--report", default=None, help="also write the per-row results as CSV")
+    parser.add_argument("--allow-admin", action="store_true", help="accept Admin rows (rejected by default)")
+    args = parser.parse_args(argv)
+
+    try:
+        rows = loadRows(args.users)
+    except (OSError, ValueError) as e:
+        print(f"❌ Could not read {args.users}: {e}")
+        return 1
+
+    fileManager = DataManagement(args.data, journaled=True, backend=os.environ.get("HAPPY_TRAILS_BACKEND", "text"))
+    try:
+        results = importUsers(fileManager, rows, workers=args.workers, allowAdmin=args.allow_admin)
+        printReport(results)
+        if args.report:
+            writeReport(results, args.report)
+            print(f"📄 Report written to {args.report}")
+    finally:
+        fileManager.close()
+
+    return 0 if all(result["status"] == "created" for result in results) else 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -54,22 +54,7 @@ class Parent(User):
         super().__init__(id,name,password,role,fileManager, authenticated)
     
     def getNewCamperID(self) -> str:
-        records = self.getFileManager().read("camper.txt")
-
-        max_id = 0
-        for line in records:
-            parts = line.split(":")
-            if len(parts) >= 6:
-                cid = parts[0]
-                if cid.startswith("CMP"):
-                    try:
-                        num = int(cid[3:])
-                        max_id = max(max_id, num)
-                    except ValueError:
-                        continue
-
-        new_id = f"CMP{max_id + 1:04d}"
-        return new_id
+        return self.getFileManager().sequences.next("CMP")
 
     def canCreate(self, roleToCreate: str) -> bool:
         return roleToCreate == "Camper"
@@ -137,17 +122,13 @@ class Parent(User):
             return
 
         fm = self.getFileManager()
-        campers = fm.read("camper.txt")
 
         camper_id = input("Enter Camper ID to update: ").strip()
 
         #Find camper
-        found = None
-        for line in campers:
-            parts = line.split(":")
-            if len(parts) >= 5 and parts[4] == self.getID() and parts[0] == camper_id:
-                found = parts
-                break
+        found = fm.findRecord("camper.txt", "id", camper_id)
+        if found and found[4] != self.getID():
+            found = None
 
         if not found:
             print("❌ Camper not found or you do not have permission to update this camper.")
@@ -173,36 +154,23 @@ class Parent(User):
             except:
                 print("❌ Invalid age.")
 
-        #Rewrite file
-        new_lines = []
-        for line in campers:
-            parts = line.split(":")
-            if len(parts) >= 5 and parts[0] == camper_id:
-                newline = f"{camper_id}:{new_name}:{new_age}:{old_dob}:{parent_id}:{new_medical}"
-                new_lines.append(newline)
-            else:
-                new_lines.append(line)
-
-        fm.write("camper.txt", new_lines, append=False)
+        #Save only the changed record
+        newline = f"{camper_id}:{new_name}:{new_age}:{old_dob}:{parent_id}:{new_medical}"
+        fm.upsert("camper.txt", newline)
 
         self.logAction(f"Updated camper {camper_id}")
 
         print("Camper updated successfully.")
 
-    def enrollCamperInSession(self):
+    def enrollCamperInSession(self, sessionManager):
         if not self.isAuthenticated():
             print("You must be logged in.")
             return
 
         fm = self.getFileManager()
-        campers = fm.read("camper.txt")
 
         print("\n--- Your Campers ---")
-        parentCampers = []
-        for line in campers:
-            parts = line.split(":")
-            if len(parts) >= 6 and parts[4] == self.getID():
-                parentCampers.append(parts)
+        parentCampers = [c for c in fm.findGroup("camper.txt", "parent", self.getID()) if len(c) >= 6]
 
         if not parentCampers:
             print("You have no registered campers.")
@@ -226,20 +194,15 @@ class Parent(User):
         print(f"Selected Camper ID: {camper_id}")
         print("Please make note of this ID.")
 
-        sessions = fm.read("session.txt")
-        if not sessions:
-            print("No sessions available.")
+        #Only sessions with open spots that take this camper's age
+        session_list = sessionManager.availableSessions(int(target[2]))
+        if not session_list:
+            print(f"No open sessions for age {target[2]}.")
             return
 
         print("\n--- Available Sessions ---")
-        session_list = []
-        for line in sessions:
-            parts = line.split(":")
-            if len(parts) >= 3:
-                session_list.append(parts)
-
         for i, s in enumerate(session_list, start=1):
-            print(f"{i}. {s[0]} - {s[1]} ({s[2]})")
+            print(f"{i}. {s.session_id} - {s.name} ({s.activity_type}) | {s.start_date}→{s.end_date} | {s.spots_available}/{s.capacity} spots")
 
         try:
             selection = int(input("Select a session by number: ").strip())
@@ -250,21 +213,12 @@ class Parent(User):
             print("Invalid session.")
             return
 
-        chosen_session = session_list[selection - 1]
-        session_id = chosen_session[0]
-
-        summary = fm.read("summary.txt")
-        for line in summary:
-            parts = line.split(":")
-            if len(parts) >= 3 and parts[0] == camper_id and parts[1] == session_id:
-                print("Camper is already enrolled in this session.")
-                return
+        session_id = session_list[selection - 1].session_id
 
-        record = f"{camper_id}:{session_id}:{self.getID()}\n"
-        fm.write("summary.txt", record, append=True)
+        #Checks ownership, age and duplicates, and waitlists the camper if the last spot was just taken
+        if sessionManager.enrollCamper(camper_id, session_id, self):
+            self.logAction(f"Enrolled camper {camper_id} in session {session_id}")
 
-        print(f"Camper {target[1]} successfully enrolled in session {session_id}.")
-             
     def showDashboard(self):
         print("\n--- PARENT DASHBOARD ---")
         print("1. Register New Camper")
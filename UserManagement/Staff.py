@@ -17,20 +17,14 @@ class Staff(User):
 
     def recordAttendance(self):
         fileManager = self.getFileManager()
-        campers = fileManager.read("camper.txt")
-        if not campers:
+        if not fileManager.recordCount("camper.txt"):
             print("❌ No campers found.")
             return
 
         camper_id = input("Enter Camper ID to record attendance: ").strip().upper()
 
         #Find camper
-        camper_line = None
-        for line in campers:
-            parts = line.strip().split(":")
-            if parts[0] == camper_id:
-                camper_line = parts
-                break
+        camper_line = fileManager.findRecord("camper.txt", "id", camper_id)
 
         if not camper_line:
             print("❌ Camper not found!")
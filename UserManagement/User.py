@@ -1,10 +1,11 @@
 import re
-import hashlib
 import getpass
 import datetime
 from DataManagement.DataManagement import DataManagement
+from Authenticator.PasswordHasher import PasswordHasher, CONFIG_FILE
 
 class User:
+    rolePrefix = {"Admin": "ADM_", "Staff": "STF_", "Parent": "PRT_"}
 
     def __init__(self, id: str, name: str, password: str, role: str, fileManager: DataManagement, authenticated: bool):
         self.__id = id
@@ -13,29 +14,34 @@ class User:
         self.__role = role
         self.__fileManager = fileManager
         self.__authenticated = authenticated
-        self.rolePrefix = {"Admin": "ADM_", "Staff": "STF_", "Parent": "PRT_"}
         self.roleHeirachy = {"Admin": ["Staff"], "Staff": ["Parent"], "Parent": ["Camper"]}
     
     #Password Management
     def encryptPassword(self, password: str) -> str:
-        return hashlib.sha256(password.encode()).hexdigest()
+        return PasswordHasher.load(self.__fileManager.getFilePath(CONFIG_FILE)).hash(password)
 
-    def validatePassword(self, password: str) -> bool:
-        if (len(password) < 8 or
+    @staticmethod
+    def isStrongPassword(password: str) -> bool:
+        return not (len(password) < 8 or
             not re.search(r"[A-Z]", password) or
             not re.search(r"[a-z]", password) or
             not re.search(r"\d", password) or
-            not re.search(r"[!@#$%^&*(),.?\":{}|<>]", password)):
+            not re.search(r"[!@#$%^&*(),.?\":{}|<>]", password))
+
+    def validatePassword(self, password: str) -> bool:
+        if not self.isStrongPassword(password):
             print("❌ Password must include uppercase, lowercase, number, and special character (min 8 chars).")
             return False
         return True
     
     def generateId(self, role: str) -> str:
-        prefix = self.rolePrefix.get(role, role[:3].upper() + "_")
-        users = self.__fileManager.read("users.txt")
-        ids = [int(line.split(":")[0].split("_")[1]) for line in users if len(line.split(":")) >= 2 and line.split(":")[1] == role]
-        nextNum = max(ids) + 1 if ids else 0
-        return f"{prefix}{nextNum}"
+        return self.allocateIds(self.__fileManager, role)[0]
+
+    #The next `count` IDs for a role, for callers that create several users at once
+    @classmethod
+    def allocateIds(cls, fileManager: DataManagement, role: str, count=1):
+        prefix = cls.rolePrefix.get(role, role[:3].upper() + "_")
+        return fileManager.sequences.allocate(prefix, count)
     
     #REGISTRATION
     def register(self):
@@ -48,10 +54,9 @@ class User:
             print(f"❌ A {self.__role} cannot create a {roleToCreate}.")
             return
 
-        users = self.__fileManager.read("users.txt")
         username = input("Enter new username: ").strip()
 
-        if any(line.split(":")[2] == username for line in users if len(line.split(":")) >= 3):
+        if self.__fileManager.findUser(username):
             print("❌ Username already exists.")
             return
 
@@ -85,9 +90,9 @@ class User:
     
     #Camper Searching
     def viewCamperInfo(self):
-        lines = self.getFileManager().read("camper.txt")
+        fileManager = self.getFileManager()
 
-        if not lines:
+        if not fileManager.recordCount("camper.txt"):
             print("No camper records found.")
             return
 
@@ -99,7 +104,7 @@ class User:
         choice = input("Choose an option: ").strip()
 
         def parse(line):
-            parts = line.split(":")
+            parts = line.split(":") if isinstance(line, str) else line
             return {
                 "camperID": parts[0],
                 "name": parts[1],
@@ -130,9 +135,10 @@ class User:
             cid = input("Enter Camper ID (e.g., CMP0001): ").strip()
             found = []
 
-            for line in lines:
-                camper = parse(line)
-                if camper["camperID"] == cid and allowed(camper):
+            record = fileManager.findRecord("camper.txt", "id", cid)
+            if record:
+                camper = parse(record)
+                if allowed(camper):
                     found.append(camper)
 
             if not found:
@@ -148,17 +154,15 @@ class User:
         #Search by name/partial name
         elif choice == "2":
             name = input("Enter full or partial name: ").strip().lower()
-            found = []
-
-            for line in lines:
-                camper = parse(line)
-                if name in camper["name"].lower() and allowed(camper):
-                    found.append(camper)
+            found = [c for c in map(parse, fileManager.searchCampers(name)) if allowed(c)]
 
             if not found:
                 print("No campers matched that name (or not authorized).")
                 return
 
+            if not any(name in c["name"].lower() for c in found):
+                print("No exact matches. Closest names:")
+
             for c in found:
                 display(c)
 
@@ -171,7 +175,7 @@ class User:
                 print("Only Admin or Staff can view all campers.")
                 return
 
-            for line in lines:
+            for line in fileManager.read("camper.txt"):
                 display(parse(line))
 
             self.logAction("Viewed all campers")
@@ -1,16 +1,18 @@
+import os
 from DataManagement.DataManagement import DataManagement
 from Authenticator.Authenticator import Authenticator
 from SessionManagement.Sessions import SessionManager
 
 def main():
     while True:
-        fileManager = DataManagement('Data/')
+        fileManager = DataManagement('Data/', journaled=True, backend=os.environ.get("HAPPY_TRAILS_BACKEND", "text"))
         auth = Authenticator(fileManager)
         SessMgmr = SessionManager(fileManager)
         
         currentUser = auth.authenticate()
         
         if not currentUser:
+            fileManager.close()
             print("Exiting program.")
             return
         
@@ -29,7 +31,50 @@ def main():
                 elif choice == "4":
                     currentUser.generateReports()
                 elif choice == "5":
-                    fileManager.backupAll()
+                    while True:
+                        print("\n====== BACKUP / RESTORE ======")
+                        print("1. Incremental Snapshot")
+                        print("2. Compressed Archive")
+                        print("3. Restore from Archive")
+                        print("4. Return to Admin Menu")
+                        print("==============================")
+
+                        choice = input("Choose an option: ").strip()
+
+                        if choice == "1":
+                            fileManager.backupAll()
+
+                        elif choice == "2":
+                            method = input("Compression (zlib/lzma) [zlib]: ").strip().lower() or "zlib"
+                            if method not in ("zlib", "lzma"):
+                                print("Invalid compression method.")
+                                continue
+                            fileManager.archiveAll(method)
+
+                        elif choice == "3":
+                            archives = fileManager.listArchives()
+                            if not archives:
+                                print("⚠️ No archives found to restore.")
+                                continue
+
+                            for i, name in enumerate(archives, start=1):
+                                print(f"{i}. {name}")
+
+                            selection = input("Select an archive by number: ").strip()
+                            if not selection.isdigit() or not 1 <= int(selection) <= len(archives):
+                                print("Invalid selection.")
+                                continue
+
+                            confirm = input("Restoring overwrites the current data. Continue? (y/n): ").strip().lower()
+                            #The session manager's in-memory sessions predate the restore
+                            if confirm == "y" and fileManager.restoreArchive(archives[int(selection) - 1]):
+                                SessMgmr.loadSessions()
+
+                        elif choice == "4":
+                            print("⬅ Returning to Admin Menu...")
+                            break
+                        else:
+                            print("Invalid option. Please try again.")
                 elif choice == "6":
                     while True:
                         print("\n====== SESSION MANAGEMENT DASHBOARD ======")
@@ -38,7 +83,14 @@ def main():
                         print("3. Delete Session")
                         print("4. View Sessions")
                         print("5. Add Camper to Session")
-                        print("6. Return to Admin Menu")
+                        print("6. Find Free Instructors")
+                        print("7. View Session Roster")
+                        print("8. View Camper Enrollments")
+                        print("9. Bulk Enroll from File")
+                        print("10. Find Open Sessions by Age")
+                        print("11. View Session Waitlist")
+                        print("12. Auto-Assign from Preferences")
+                        print("13. Return to Admin Menu")
                         print("==========================================")
 
                         choice = input("Choose an option: ").strip()
@@ -59,6 +111,27 @@ def main():
                             SessMgmr.enrollCamperInteractive(currentUser)
 
                         elif choice == "6":
+                            SessMgmr.freeInstructorsInteractive()
+
+                        elif choice == "7":
+                            SessMgmr.viewRosterInteractive()
+
+                        elif choice == "8":
+                            SessMgmr.viewCamperEnrollmentsInteractive()
+
+                        elif choice == "9":
+                            SessMgmr.bulkEnrollInteractive(currentUser)
+
+                        elif choice == "10":
+                            SessMgmr.displaySessionsForAgeInteractive()
+
+                        elif choice == "11":
+                            SessMgmr.viewWaitlistInteractive()
+
+                        elif choice == "12":
+                            SessMgmr.autoAssignInteractive(currentUser)
+
+                        elif choice == "13":
                             print("⬅ Returning to Admin Menu...")
                             break
                         else:
@@ -67,6 +140,8 @@ def main():
                 elif choice == "7":
                     currentUser.viewCamperInfo()
                 elif choice == "8":
+                    currentUser.bulkImportInteractive()
+                elif choice == "9":
                     print("Logging out...")
                     currentUser = None
                     break
@@ -94,7 +169,7 @@ def main():
                 elif choice == "2":
                     currentUser.updateCamper()
                 elif choice == "3":
-                    currentUser.enrollCamperInSession()
+                    currentUser.enrollCamperInSession(SessMgmr)
                 elif choice == "4":
                     print("Logging out...")
                     break
@@ -105,6 +180,9 @@ def main():
                 print("Unknown role. Exiting.")
                 break
 
+        #Flush queued log records before the next login
+        fileManager.close()
+
 print("=================================================================")
 print("\t\tWELCOME TO HAPPY TRAILS SUMMER CAMP")
 print("=================================================================")
@@ -0,0 +1,105 @@
+import os
+import io
+import shutil
+import tempfile
+import unittest
+import contextlib
+from unittest import mock
+
+from DataManagement.DataManagement import DataManagement
+from SessionManagement.Sessions import Session, SessionManager
+from SessionManagement.AutoAssign import AutoAssigner
+
+CAMPERS = [
+    "CMP0001:Ada Lovelace:10:2015-01-01:PRT_1:N/A",
+    "CMP0002:Alan Turing:11:2014-01-01:PRT_1:N/A",
+    "CMP0003:Grace Hopper:12:2013-01-01:PRT_2:N/A"
+]
+SESSIONS = [
+    Session("S1000001", "Archery Week 1", "Archery", "2025-06-01", "2025-06-07", "Ages 8-14", 8, 14, 1, 1, "STF_1"),
+    Session("S1000002", "Canoeing Week 1", "Canoeing", "2025-06-01", "2025-06-07", "Ages 8-14", 8, 14, 5, 5, "STF_2"),
+    Session("S1000003", "Drama Week 2", "Drama", "2025-06-08", "2025-06-14", "Ages 8-14", 8, 14, 5, 5, "STF_3")
+]
+
+
+class AutoAssignTest(unittest.TestCase):
+    def setUp(self):
+        self.workdir = tempfile.mkdtemp(prefix="happytrails-test-")
+        self.dataDirectory = os.path.join(self.workdir, "Data") + os.sep
+        os.makedirs(self.dataDirectory)
+        with open(os.path.join(self.dataDirectory, "camper.txt"), "w", encoding="utf-8") as file:
+            file.writelines(f"{line}\n" for line in CAMPERS)
+        with open(os.path.join(self.dataDirectory, "sessions.txt"), "w", encoding="utf-8") as file:
+            file.writelines(session.toRecord() for session in SESSIONS)
+        self.instances = []
+
+    def tearDown(self):
+        for fileManager in self.instances:
+            fileManager.close()
+        shutil.rmtree(self.workdir, ignore_errors=True)
+
+    def manager(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            fileManager = DataManagement(self.dataDirectory, os.path.join(self.workdir, "Data-Bak") + os.sep,
+                                         os.path.join(self.workdir, "Reports") + os.sep, journaled=True)
+            self.instances.append(fileManager)
+            return SessionManager(fileManager)
+
+    def writePreferences(self, rows):
+        path = os.path.join(self.workdir, "preferences.csv")
+        with open(path, "w", encoding="utf-8") as file:
+            file.writelines(",".join(row) + "\n" for row in rows)
+        return path
+
+    def enrolled(self, manager):
+        return sorted((r[1], r[0]) for r in (line.split(":") for line in manager.fileManager.read("session_enrollments.txt")))
+
+    def runInteractive(self, manager, path, beforeConfirm):
+        answers = iter([path, "y"])
+
+        def answer(prompt=""):
+            value = next(answers)
+            if value == "y":
+                beforeConfirm()
+            return value
+
+        with mock.patch("builtins.input", answer), contextlib.redirect_stdout(io.StringIO()) as output:
+            manager.autoAssignInteractive(None)
+        return output.getvalue()
+
+    def testConfirmCommitsThePreviewedAssignment(self):
+        manager = self.manager()
+        path = self.writePreferences([["CMP0001", "S1000002"], ["CMP0002", "S1000003"]])
+
+        #The file changes between the preview and the confirmation
+        self.runInteractive(manager, path, lambda: self.writePreferences([["CMP0001", "S1000003"], ["CMP0003", "S1000002"]]))
+
+        self.assertEqual(self.enrolled(manager), [("CMP0001", "S1000002"), ("CMP0002", "S1000003")])
+
+    def testCommitRechecksCapacity(self):
+        manager = self.manager()
+        other = self.manager()
+        path = self.writePreferences([["CMP0001", "S1000001"]])
+
+        #Another terminal takes the only spot after the preview
+        output = self.runInteractive(manager, path, lambda: other.enrollCampersBulk([("CMP0002", "S1000001")]))
+
+        self.assertEqual(self.enrolled(manager), [("CMP0002", "S1000001")])
+        self.assertEqual(manager.sessions["S1000001"].spots_available, 0)
+        self.assertTrue(manager.getWaitlist().contains("S1000001", "CMP0001"))
+        self.assertIn("could not be enrolled as shown", output)
+
+    def testChoicesOverlappingAnEnrollmentAreSkipped(self):
+        manager = self.manager()
+        with contextlib.redirect_stdout(io.StringIO()):
+            manager.enrollCampersBulk([("CMP0001", "S1000002")])
+
+        options, rejected = AutoAssigner(manager).buildOptions({"CMP0001": ["S1000001", "S1000003"]})
+
+        #S1000001 runs the same week as S1000002
+        self.assertEqual(options, {"CMP0001": [(1, "S1000003")]})
+        self.assertEqual(rejected, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
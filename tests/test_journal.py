@@ -0,0 +1,66 @@
+import os
+import shutil
+import tempfile
+import unittest
+import contextlib
+import io
+
+from DataManagement.DataManagement import DataManagement
+
+
+class MixedJournalTest(unittest.TestCase):
+    #A journaled and a plain instance sharing one Data/ directory must see each other's writes
+    def setUp(self):
+        self.workdir = tempfile.mkdtemp(prefix="happytrails-test-")
+        self.instances = []
+
+    def tearDown(self):
+        for fileManager in self.instances:
+            fileManager.close()
+        shutil.rmtree(self.workdir, ignore_errors=True)
+
+    def open(self, journaled):
+        with contextlib.redirect_stdout(io.StringIO()):
+            fileManager = DataManagement(os.path.join(self.workdir, "Data") + os.sep,
+                                         os.path.join(self.workdir, "Data-Bak") + os.sep,
+                                         os.path.join(self.workdir, "Reports") + os.sep,
+                                         journaled=journaled)
+        self.instances.append(fileManager)
+        return fileManager
+
+    def names(self, fileManager):
+        return {line.split(":")[0]: line.split(":")[1] for line in fileManager.read("camper.txt")}
+
+    def testPlainAppendKeepsJournaledChanges(self):
+        journaled = self.open(True)
+        plain = self.open(False)
+
+        journaled.write("camper.txt", "CMP0001:Ada Lovelace:10:2015-01-01:PRT_1:N/A\n", append=False)
+        journaled.upsert("camper.txt", "CMP0001:Ada King:10:2015-01-01:PRT_1:N/A")
+        journaled.write("camper.txt", "CMP0002:Alan Turing:11:2014-01-01:PRT_1:N/A\n", append=True)
+
+        #The plain instance replays the journal it did not write
+        self.assertEqual(self.names(plain), {"CMP0001": "Ada King", "CMP0002": "Alan Turing"})
+
+        plain.write("camper.txt", "CMP0003:Grace Hopper:12:2013-01-01:PRT_2:N/A\n", append=True)
+
+        expected = {"CMP0001": "Ada King", "CMP0002": "Alan Turing", "CMP0003": "Grace Hopper"}
+        self.assertEqual(self.names(plain), expected)
+        self.assertEqual(self.names(journaled), expected)
+        self.assertEqual(journaled.findCamper("CMP0002")[1], "Alan Turing")
+
+    def testPlainRewriteAfterJournaledDelete(self):
+        journaled = self.open(True)
+        plain = self.open(False)
+
+        journaled.write("camper.txt", ["CMP0001:Ada:10:2015-01-01:PRT_1:N/A\n",
+                                       "CMP0002:Alan:11:2014-01-01:PRT_1:N/A\n"], append=False)
+        journaled.delete("camper.txt", "CMP0001")
+        plain.upsert("camper.txt", "CMP0002:Alan Turing:11:2014-01-01:PRT_1:N/A")
+
+        self.assertEqual(self.names(journaled), {"CMP0002": "Alan Turing"})
+        self.assertEqual(self.names(self.open(False)), {"CMP0002": "Alan Turing"})
+
+
+if __name__ == "__main__":
+    unittest.main()
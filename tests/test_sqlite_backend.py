@@ -0,0 +1,64 @@
+import os
+import io
+import shutil
+import sqlite3
+import tempfile
+import threading
+import unittest
+import contextlib
+
+from DataManagement.DataManagement import DataManagement
+
+
+class SqliteBackendCloseTest(unittest.TestCase):
+    def setUp(self):
+        self.workdir = tempfile.mkdtemp(prefix="happytrails-test-")
+
+    def tearDown(self):
+        shutil.rmtree(self.workdir, ignore_errors=True)
+
+    def open(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return DataManagement(os.path.join(self.workdir, "Data") + os.sep,
+                                  os.path.join(self.workdir, "Data-Bak") + os.sep,
+                                  os.path.join(self.workdir, "Reports") + os.sep,
+                                  journaled=True, backend="sqlite")
+
+    def testCloseReleasesEveryThreadsConnection(self):
+        fileManager = self.open()
+        fileManager.upsert("camper.txt", "CMP0001:Ada Lovelace:10:2015-01-01:PRT_1:N/A")
+        fileManager.write("log.txt", "ADM_1:admin:Logged in:2025-01-01 09:00:00\n", append=True)
+
+        worker = threading.Thread(target=lambda: fileManager.findCamper("CMP0001"))
+        worker.start()
+        worker.join()
+
+        connections = list(fileManager.backend.connections)
+        self.assertGreaterEqual(len(connections), 2)
+
+        fileManager.close()
+
+        self.assertEqual(fileManager.backend.connections, [])
+        for conn in connections:
+            with self.assertRaises(sqlite3.ProgrammingError):
+                conn.execute("SELECT 1")
+        #The last connection to close checkpoints and removes the write-ahead log
+        self.assertFalse(os.path.exists(fileManager.backend.path + "-wal"))
+
+    def testLoginsDoNotAccumulateConnections(self):
+        #main.py builds a new DataManagement for every login
+        for _ in range(3):
+            fileManager = self.open()
+            self.assertIsNone(fileManager.findUser("nobody"))
+            fileManager.close()
+            self.assertEqual(fileManager.backend.connections, [])
+            self.assertFalse(os.path.exists(fileManager.backend.path + "-wal"))
+
+        reopened = self.open()
+        reopened.upsert("camper.txt", "CMP0002:Alan Turing:11:2014-01-01:PRT_1:N/A")
+        self.assertEqual(reopened.findCamper("CMP0002")[1], "Alan Turing")
+        reopened.close()
+
+
+if __name__ == "__main__":
+    unittest.main()